@@ -0,0 +1,29 @@
+"""unique archive label key
+
+Revision ID: a18d9c3f7e52
+Revises: e72f1c8b6a40
+Create Date: 2025-08-02 10:27:19.604481
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a18d9c3f7e52'
+down_revision: Union[str, Sequence[str], None] = 'e72f1c8b6a40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index('ix_archivelabel_lookup', table_name='archivelabel')
+    op.create_index('uq_archive_label_key', 'archivelabel', ['archive_id', 'label', 'start_position', 'end_position'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_archive_label_key', table_name='archivelabel')
+    op.create_index('ix_archivelabel_lookup', 'archivelabel', ['archive_id', 'label', 'start_position', 'end_position'], unique=False)
@@ -0,0 +1,31 @@
+"""add status indexes
+
+Revision ID: b4c7e02a913f
+Revises: 81cd88ecd379
+Create Date: 2025-08-02 09:12:31.402218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4c7e02a913f'
+down_revision: Union[str, Sequence[str], None] = '81cd88ecd379'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_posting_status_updated', 'posting', ['fetching_status', 'last_updated'], unique=False)
+    op.create_index(op.f('ix_postinglink_fetching_status'), 'postinglink', ['fetching_status'], unique=False)
+    op.create_index(op.f('ix_archivecontent_is_inference_done'), 'archivecontent', ['is_inference_done'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_archivecontent_is_inference_done'), table_name='archivecontent')
+    op.drop_index(op.f('ix_postinglink_fetching_status'), table_name='postinglink')
+    op.drop_index('ix_posting_status_updated', table_name='posting')
@@ -0,0 +1,39 @@
+"""add foreign key indexes
+
+Revision ID: d91a6f4e25c8
+Revises: b4c7e02a913f
+Create Date: 2025-08-02 09:41:07.118634
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd91a6f4e25c8'
+down_revision: Union[str, Sequence[str], None] = 'b4c7e02a913f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_postinglink_posting_id'), 'postinglink', ['posting_id'], unique=False)
+    op.create_index('ix_postinglink_posting_kind', 'postinglink', ['posting_id', 'kind'], unique=False)
+    op.create_index(op.f('ix_archiveentry_parent_id'), 'archiveentry', ['parent_id'], unique=False)
+    op.create_index(op.f('ix_archiveentry_posting_id'), 'archiveentry', ['posting_id'], unique=False)
+    op.create_index(op.f('ix_archivecontent_posting_id'), 'archivecontent', ['posting_id'], unique=False)
+    op.create_index(op.f('ix_archivecontent_entry_id'), 'archivecontent', ['entry_id'], unique=False)
+    op.create_index(op.f('ix_archivelabel_archive_id'), 'archivelabel', ['archive_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_archivelabel_archive_id'), table_name='archivelabel')
+    op.drop_index(op.f('ix_archivecontent_entry_id'), table_name='archivecontent')
+    op.drop_index(op.f('ix_archivecontent_posting_id'), table_name='archivecontent')
+    op.drop_index(op.f('ix_archiveentry_posting_id'), table_name='archiveentry')
+    op.drop_index(op.f('ix_archiveentry_parent_id'), table_name='archiveentry')
+    op.drop_index('ix_postinglink_posting_kind', table_name='postinglink')
+    op.drop_index(op.f('ix_postinglink_posting_id'), table_name='postinglink')
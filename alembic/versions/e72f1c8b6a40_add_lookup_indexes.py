@@ -0,0 +1,29 @@
+"""add lookup indexes
+
+Revision ID: e72f1c8b6a40
+Revises: d91a6f4e25c8
+Create Date: 2025-08-02 10:05:44.921377
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e72f1c8b6a40'
+down_revision: Union[str, Sequence[str], None] = 'd91a6f4e25c8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_archiveentry_name'), 'archiveentry', ['name'], unique=False)
+    op.create_index('ix_archivelabel_lookup', 'archivelabel', ['archive_id', 'label', 'start_position', 'end_position'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_archivelabel_lookup', table_name='archivelabel')
+    op.drop_index(op.f('ix_archiveentry_name'), table_name='archiveentry')
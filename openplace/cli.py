@@ -1,15 +1,13 @@
 import os
 
-from openplace.workflows.metadata import discover_new_postings
-from openplace.workflows.files import download_pending_files, ingest_labels 
-from openplace.tasks.export.archives import export_archives as export_archives_task
-from openplace.tasks.extract.markdown import extract_all_archives_concurrently
-
-import openplace.storage.local.queries as q
+# heavy imports (workflows, storage, extraction) are deferred to each command
+# body so that CLI startup only pays for what the invoked command needs
 
 import logging
 import typer
 
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 from typer import Option
 from openplace.tasks.store.types import StorageType
@@ -17,6 +15,24 @@ from openplace.tasks.store.types import StorageType
 
 logger = logging.getLogger(__name__)
 
+def _local_backend():
+    import openplace.storage.local.queries as queries
+    return queries
+
+STORAGE_BACKENDS = {
+    StorageType.LOCAL: _local_backend,
+}
+"""Registry mapping each storage type to a factory returning its query backend."""
+
+def get_backend(storage: StorageType):
+    """
+    Resolve the query backend for a storage type via a single registry lookup.
+    """
+    factory = STORAGE_BACKENDS.get(storage)
+    if factory is None:
+        raise ValueError(f"Storage type {storage} not supported")
+    return factory()
+
 app = typer.Typer(
     name="openplace",
     add_completion=False,
@@ -38,6 +54,7 @@ def discover(
     If --resume is used, the iterator will start from the last state of the previous run.
     If --ensure-n-new-links is used, the iterator will continue until the number of new links is reached.
     """
+    from openplace.workflows.metadata import discover_new_postings
     if debug:
         logging.basicConfig(level=logging.DEBUG)
     discover_new_postings(n, storage, resume, ensure_n_new_links)
@@ -47,19 +64,20 @@ def list_postings(
     storage: StorageType = Option(StorageType.LOCAL, "--storage", "-S", help="Storage type"),
     limit: int = Option(100, "--limit", "-l", help="Maximum number of postings to return"),
     status: str = Option(None, "--status", "-s", help="Status of the postings"),
+    after_id: int = Option(None, "--after-id", "-a", help="Keyset cursor: only list postings with an id below this value. Use the last printed id to fetch the next page."),
 ):
     """
     List postings.
     """
+    backend = get_backend(storage)
 
-    if storage == StorageType.LOCAL:
-        postings = q.list_postings(storage=storage, limit=limit, status=status)
-        if postings:
-            typer.echo("id|org_acronym|organization|title|fetching_status|last_updated")
-            for posting in postings:
-                typer.echo(f"{posting.id}|{posting.org_acronym}|{posting.organization}|{posting.title}|{posting.fetching_status}|{posting.last_updated}")
-    else:
-        raise ValueError(f"Storage type {storage} not supported")
+    typer.echo("id|org_acronym|organization|title|fetching_status|last_updated")
+    last_id = None
+    for row in backend.list_posting_rows(storage=storage, limit=limit, status=status, after_id=after_id):
+        typer.echo("|".join(map(str, row)))
+        last_id = row[0]
+    if last_id is not None:
+        typer.echo(f"Next page: --after-id {last_id}")
 
 @app.command()
 def list_links(
@@ -67,13 +85,9 @@ def list_links(
     storage: StorageType = Option(StorageType.LOCAL, "--storage", "-S", help="Storage type"),
     ):
     """"""
-    if storage == StorageType.LOCAL:
-        links = q.get_posting_links(posting_id)
-
-    else:
-        raise ValueError(f"Storage type {storage} not supported")
+    backend = get_backend(storage)
 
-    for link in links:
+    for link in backend.get_posting_links(posting_id):
         typer.echo(link)
 
 @app.command()
@@ -84,10 +98,8 @@ def remove_posting(
     """
     Remove a posting.
     """
-    if storage == StorageType.LOCAL:
-        q.remove_posting(posting_id)
-    else:
-        raise ValueError(f"Storage type {storage} not supported")
+    backend = get_backend(storage)
+    backend.remove_posting(posting_id)
 
 @app.command()
 def fetch_archives(
@@ -98,6 +110,8 @@ def fetch_archives(
     """
     Download pending files.
     """
+    from openplace.workflows.files import download_pending_files
+
     if debug:
         logging.basicConfig(level=logging.DEBUG)
     if storage == StorageType.LOCAL:
@@ -113,6 +127,8 @@ def extract_markdown(
     """
     Extract markdown from archives.
     """
+    from openplace.tasks.extract.markdown import extract_all_archives_concurrently
+
     if debug:
         logging.basicConfig(level=logging.DEBUG)
     extract_all_archives_concurrently(directory)
@@ -123,6 +139,8 @@ def export_archives(
     output_format: str = Option("parquet", "--output-format", "-f", help="Output format", show_default=True),
     compression: str = Option("gzip", "--compression", "-C", help="Compression method for jsonl and csv", show_default=True),
     filename_date: bool = Option(False, "--filename-date", "-D", help="Include date in filename (output files will be named archives-<date>.parquet, archives-<date>.jsonl.gz, etc.)", show_default=True),
+    dates_only: bool = Option(False, "--dates-only", "-d", help="Only export the date-bearing paragraphs of each content, filtered inside DuckDB", show_default=True),
+    split_output: bool = Option(False, "--split-output", "-P", help="Write one Parquet part file per writer thread into a directory; bounds memory on very large tables", show_default=True),
     debug: bool = Option(False, "--debug", "-D", help="Debug mode", show_default=True),
 ):
     """
@@ -130,9 +148,11 @@ def export_archives(
     If no output directory is provided, the archives will be exported to a file named "archives-<date>.parquet" in the current directory.
     If no output format is provided, the archives will be exported to a parquet file.
     """
+    from openplace.tasks.export.archives import export_archives as export_archives_task
+
     if debug:
         logging.basicConfig(level=logging.DEBUG)
-    export_archives_task(output_dir=output_dir, output_format=output_format, compression=compression, use_date_in_filename=filename_date)
+    export_archives_task(output_dir=output_dir, output_format=output_format, compression=compression, use_date_in_filename=filename_date, dates_only=dates_only, split_output=split_output)
 
 
 @app.command()
@@ -145,44 +165,59 @@ def export_archive_content(
     """
     Export an archive content to a file.
     """
-    if storage == StorageType.LOCAL:
-        archive_content = q.get_archive_content_by_id(archive_content_id)
-        if archive_content is None:
-            typer.echo(f"Archive content with id {archive_content_id} not found")
-            return
-        if archive_content_id != archive_content.id:
-            typer.echo(f"Archive content id mismatch: {archive_content_id} != {archive_content.id}")
-            return
-        if to_terminal:
-            typer.echo(archive_content.content)
-        else:
-            output_path = Path(output_file) or Path(f"archive_content_{archive_content_id}.txt")
-            output_path.write_text(archive_content.content)
-            typer.echo(f"Archive content exported to {output_path}")
+    backend = get_backend(storage)
+
+    archive_content = backend.get_archive_content_by_id(archive_content_id)
+    if archive_content is None:
+        typer.echo(f"Archive content with id {archive_content_id} not found")
+        return
+    if to_terminal:
+        typer.echo(archive_content.content)
     else:
-        raise ValueError(f"Storage type {storage} not supported")
+        output_path = Path(output_file) if output_file else Path(f"archive_content_{archive_content_id}.txt")
+        output_path.write_bytes(archive_content.content.encode("utf-8"))
+        typer.echo(f"Archive content exported to {output_path}")
 
 @app.command()
 def bulk_export_archive_contents(
     storage: StorageType = Option(StorageType.LOCAL, "--storage", "-S", help="Storage type", show_default=True),
     limit: int = Option(100, "--limit", "-l", help="Limit the number of archive contents to list", show_default=True),
     output_dir: str = Option(os.getcwd(), "--output-dir", "-o", help="Output directory, defaults to current working directory", show_default=True),
-    silent: bool = Option(False, "--silent", "-s", help="Silent mode", show_default=True)
+    silent: bool = Option(False, "--silent", "-s", help="Silent mode", show_default=True),
+    parquet: bool = Option(False, "--parquet", "-p", help="Write a single Parquet file instead of one .txt file per content", show_default=True),
 ):
     """
     List unprocessed archive contents.
     """
-    if storage == StorageType.LOCAL:
-        archive_contents = q.get_unprocessed_archive_contents(limit=limit)
+    backend = get_backend(storage)
+
+    if parquet:
+        from openplace.tasks.export.archives import export_unprocessed_contents
+        output_path = Path(output_dir) / "archive_contents.parquet"
+        export_unprocessed_contents(str(output_path), limit=limit, db_path=os.environ.get("LOCAL_DB_PATH", "openplace.db"))
         if not silent:
-            typer.echo(f"Found {len(archive_contents)} unprocessed archive contents")
-        for archive_content in archive_contents:
-            output_path = Path(output_dir) / f"{archive_content.id}.txt"
-            output_path.write_text(archive_content.content)
-            if not silent:
-                typer.echo(f"Archive content exported to {output_path}")
-    else:
-        raise ValueError(f"Storage type {storage} not supported")
+            typer.echo(f"Archive contents exported to {output_path}")
+        return
+    archive_contents = backend.get_unprocessed_archive_contents(limit=limit)
+
+    def write_content(archive_content) -> Path:
+        output_path = Path(output_dir) / f"{archive_content.id}.txt"
+        output_path.write_text(archive_content.content)
+        return output_path
+
+    # file writes release the GIL, so a thread pool scales with SSD queue depth;
+    # the query streams from the database, and submitting islice chunks keeps
+    # it streaming — a bare executor.map would drain the whole generator up
+    # front and hold every content in memory at once
+    num_exported = 0
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        while chunk := list(islice(archive_contents, 256)):
+            for output_path in executor.map(write_content, chunk):
+                num_exported += 1
+                if not silent:
+                    typer.echo(f"Archive content exported to {output_path}")
+    if not silent:
+        typer.echo(f"Exported {num_exported} unprocessed archive contents")
 
 @app.command()
 def bulk_ingest_labels(
@@ -194,6 +229,8 @@ def bulk_ingest_labels(
     """
     Bulk ingest labels.
     """
+    from openplace.workflows.files import ingest_labels
+
     if debug:
         logging.basicConfig(level=logging.DEBUG)
     if storage == StorageType.LOCAL:
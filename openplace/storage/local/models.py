@@ -1,4 +1,5 @@
-from sqlmodel import Field, SQLModel
+from sqlalchemy import Index, UniqueConstraint
+from sqlmodel import Field, Relationship, SQLModel
 from datetime import datetime
 from typing import Optional
 from enum import Enum
@@ -21,7 +22,7 @@ class PostingPage(SQLModel, table=True):
     """
     id: int | None = Field(None, primary_key=True, index=True)
     url: str = Field(nullable=False)
-    created_at: datetime = Field(nullable=False, default=datetime.now())
+    created_at: datetime = Field(nullable=False, default_factory=datetime.now)
     content: str = Field(nullable=False)
 
 class Posting(SQLModel, table=True):
@@ -38,6 +39,8 @@ class Posting(SQLModel, table=True):
         org_acronym (str): Acronym of the organization.
         last_updated (datetime): Last updated timestamp.
     """
+    __table_args__ = (Index("ix_posting_status_updated", "fetching_status", "last_updated"),)
+
     id: int | None = Field(None, primary_key=True, index=True)
     reference: str = Field(nullable=False)
     url: str = Field(nullable=False)
@@ -45,26 +48,33 @@ class Posting(SQLModel, table=True):
     description: str = Field(nullable=False)
     organization: str = Field(nullable=False)
     org_acronym: str = Field(nullable=False)
-    last_updated: datetime = Field(nullable=False, default=datetime.now())
+    last_updated: datetime = Field(nullable=False, default_factory=datetime.now)
     is_fetching_done: bool = Field(default=False, nullable=False)
     fetching_status: FetchingStatus = Field(default=FetchingStatus.PENDING, nullable=False)
 
+    links: list["PostingLink"] = Relationship(back_populates="posting")
+
 class PostingLink(SQLModel, table=True):
     """
     Database model representing a link to a PLACE public market posting.
 
     When a Posting is deleted, all associated PostingLink records are also deleted (ON DELETE CASCADE).
     """
+    __table_args__ = (Index("ix_postinglink_posting_kind", "posting_id", "kind"),)
+
     id: int | None = Field(None, primary_key=True, index=True)
     posting_id: int = Field(
         nullable=False,
         foreign_key="posting.id",
-        ondelete="CASCADE"
+        ondelete="CASCADE",
+        index=True,
     )
     url: str = Field(nullable=False)
     kind: str = Field(nullable=False)
-    fetching_status: FetchingStatus = Field(default=FetchingStatus.PENDING, nullable=False)
-    last_updated: datetime = Field(nullable=False, default=datetime.now())
+    fetching_status: FetchingStatus = Field(default=FetchingStatus.PENDING, nullable=False, index=True)
+    last_updated: datetime = Field(nullable=False, default_factory=datetime.now)
+
+    posting: Optional[Posting] = Relationship(back_populates="links")
 
 class ArchiveEntry(SQLModel, table=True):
     """
@@ -79,10 +89,10 @@ class ArchiveEntry(SQLModel, table=True):
         is_extracted (bool): Extraction status.
     """
     id: int | None = Field(None, primary_key=True, index=True)
-    name: str = Field(nullable=False)
+    name: str = Field(nullable=False, index=True)
     path: str = Field(nullable=False, index=True)
-    parent_id: Optional[int] = Field(foreign_key="archiveentry.id")
-    posting_id: int = Field(nullable=False, foreign_key="posting.id")
+    parent_id: Optional[int] = Field(foreign_key="archiveentry.id", index=True)
+    posting_id: int = Field(nullable=False, foreign_key="posting.id", index=True)
     is_dir: bool = Field(nullable=False)
     is_extracted: bool = Field(default=False, nullable=False)
 
@@ -93,11 +103,11 @@ class ArchiveContent(SQLModel, table=True):
     id: int | None = Field(None, primary_key=True, index=True)
     path: str = Field(nullable=False, index=True)
     content: str = Field(nullable=False)
-    created_at: datetime = Field(nullable=False, default=datetime.now())
-    updated_at: datetime = Field(nullable=False, default=datetime.now())
-    posting_id: int = Field(nullable=False, foreign_key="posting.id")
-    entry_id: Optional[int] = Field(nullable=True, foreign_key="archiveentry.id")
-    is_inference_done: bool = Field(default=False, nullable=False)
+    created_at: datetime = Field(nullable=False, default_factory=datetime.now)
+    updated_at: datetime = Field(nullable=False, default_factory=datetime.now)
+    posting_id: int = Field(nullable=False, foreign_key="posting.id", index=True)
+    entry_id: Optional[int] = Field(nullable=True, foreign_key="archiveentry.id", index=True)
+    is_inference_done: bool = Field(default=False, nullable=False, index=True)
 
 class ArchiveLabel(SQLModel, table=True):
     """
@@ -106,12 +116,14 @@ class ArchiveLabel(SQLModel, table=True):
     When a Posting is deleted, all associated ArchiveLabel records are also deleted (ON DELETE CASCADE).
     When an ArchiveEntry is deleted, all associated ArchiveLabel records are also deleted (ON DELETE CASCADE).
     """
+    __table_args__ = (UniqueConstraint("archive_id", "label", "start_position", "end_position", name="uq_archive_label_key"),)
+
     id: int | None = Field(None, primary_key=True, index=True)
-    archive_id: int = Field(nullable=False, foreign_key="archiveentry.id", ondelete="CASCADE")
+    archive_id: int = Field(nullable=False, foreign_key="archiveentry.id", ondelete="CASCADE", index=True)
     start_position: int = Field(nullable=False)
     end_position: int = Field(nullable=False)
     label: str = Field(nullable=False)
     score: float = Field(nullable=False)
     text: str = Field(nullable=False)
-    created_at: datetime = Field(nullable=False, default=datetime.now())
-    updated_at: datetime = Field(nullable=False, default=datetime.now())
\ No newline at end of file
+    created_at: datetime = Field(nullable=False, default_factory=datetime.now)
+    updated_at: datetime = Field(nullable=False, default_factory=datetime.now)
\ No newline at end of file
@@ -1,10 +1,13 @@
 import logging
 from datetime import datetime
+from sqlalchemy import bindparam, delete, event, insert, tuple_, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import selectinload
 from sqlmodel import Session, select, not_
 from typing import Sequence, Optional, Iterator
 
 from openplace.storage.local.models import PostingLink, ArchiveEntry, FetchingStatus, Posting, ArchiveContent, ArchiveLabel
-from openplace.storage.local.settings import connect_to_db
+from openplace.storage.local.settings import connect_to_db, writing_transaction
 from openplace.tasks.store.types import StorageType
 
 from functools import wraps
@@ -21,19 +24,46 @@ def ensure_session(func: Callable[..., Any]) -> Callable[..., Any]:
     Decorator to ensure that a SQLModel Session is provided to the decorated function.
     If the session argument is None, it will create a new session using connect_to_db.
     """
-    sig = inspect.signature(func)
+    # resolve the session parameter's position once at decoration time so the
+    # per-call wrapper stays free of inspect/bind machinery
+    params = list(inspect.signature(func).parameters)
+    session_idx = params.index("session") if "session" in params else None
 
     @wraps(func)
     def wrapper(*args, **kwargs) -> Any:
-        bound = sig.bind_partial(*args, **kwargs)
-        bound.apply_defaults()
-        session = bound.arguments.get("session", None)
-        if session is None:
+        if session_idx is not None and len(args) > session_idx:
+            if args[session_idx] is None:
+                _, session = connect_to_db()
+                args = args[:session_idx] + (session,) + args[session_idx + 1:]
+        elif kwargs.get("session") is None:
             _, session = connect_to_db()
-            bound.arguments["session"] = session
-        return func(*bound.args, **bound.kwargs)
+            kwargs["session"] = session
+        return func(*args, **kwargs)
     return wrapper
 
+def _lookup_cache(session: Session) -> dict:
+    """
+    Per-session cache for repeated point lookups (same path/filename queried
+    several times during an extraction run). Cleared whenever the session
+    flushes, commits or rolls back, so cached rows can never outlive a write.
+    """
+    return session.info.setdefault("lookup_cache", {})
+
+def _clear_lookup_cache(session: Session, *args) -> None:
+    session.info.get("lookup_cache", {}).clear()
+
+event.listen(Session, "after_flush", _clear_lookup_cache)
+event.listen(Session, "after_commit", _clear_lookup_cache)
+event.listen(Session, "after_rollback", _clear_lookup_cache)
+
+# hot SELECTs built once at import: callers only bind parameters instead of
+# reconstructing the expression tree on every call
+_Q_POSTING_LINKS = select(PostingLink).where(PostingLink.posting_id == bindparam("pid"))
+_Q_POSTING_LINKS_BY_KIND = select(PostingLink).where(
+    PostingLink.posting_id == bindparam("pid"), PostingLink.kind == bindparam("kind")
+)
+_Q_ARCHIVE_CONTENT_BY_ID = select(ArchiveContent).where(ArchiveContent.id == bindparam("cid"))
+
 @ensure_session
 def get_posting_links(posting_id: int, session: Optional[Session] = None) -> Sequence[PostingLink]:
     """
@@ -41,7 +71,7 @@ def get_posting_links(posting_id: int, session: Optional[Session] = None) -> Seq
     """
     if session is None:
         raise ValueError("Session is required")
-    return session.exec(select(PostingLink).where(PostingLink.posting_id == posting_id)).all()
+    return session.exec(_Q_POSTING_LINKS, params={"pid": posting_id}).all()
 
 @ensure_session
 def get_posting_links_by_kind(posting_id: int, kind: str, session: Optional[Session] = None) -> Sequence[PostingLink]:
@@ -50,7 +80,7 @@ def get_posting_links_by_kind(posting_id: int, kind: str, session: Optional[Sess
     """
     if session is None:
         raise ValueError("Session is required")
-    return session.exec(select(PostingLink).where(PostingLink.posting_id == posting_id, PostingLink.kind == kind)).all()
+    return session.exec(_Q_POSTING_LINKS_BY_KIND, params={"pid": posting_id, "kind": kind}).all()
 
 @ensure_session
 def list_postings(
@@ -58,25 +88,75 @@ def list_postings(
     storage: StorageType = StorageType.LOCAL,
     limit: int = 100,
     status: Optional[FetchingStatus] = None,
-) -> Sequence[Posting]:
+    after_id: Optional[int] = None,
+) -> Iterator[Posting]:
+    """
+    List all postings, streamed lazily from the database.
+    Pagination uses a keyset cursor (`after_id`) instead of OFFSET so that
+    deep pages stay as cheap as the first one.
+
+    Args:
+        session (Session): SQLModel session for database operations.
+        storage (StorageType): Storage type.
+        limit (int): Maximum number of postings to return.
+        status (FetchingStatus): Status of the postings.
+        after_id (Optional[int]): Keyset cursor; only postings with an id
+            strictly below this value are returned.
+    Returns:
+        Iterator[Posting]: Iterator over postings, fetched in server-side batches.
+    """
+    if session is None:
+        raise ValueError("Session is required")
+    if storage == StorageType.LOCAL:
+        query = select(Posting).order_by(Posting.id.desc())  # type: ignore[union-attr]
+        if status is not None:
+            query = query.where(Posting.fetching_status == status)
+        if after_id is not None:
+            query = query.where(Posting.id < after_id)
+        yield from session.exec(query.limit(limit).execution_options(yield_per=500))
+    else:
+        raise ValueError(f"Storage type {storage} not supported")
+
+@ensure_session
+def list_posting_rows(
+    session: Optional[Session] = None,
+    storage: StorageType = StorageType.LOCAL,
+    limit: int = 100,
+    status: Optional[FetchingStatus] = None,
+    after_id: Optional[int] = None,
+) -> Iterator[tuple]:
     """
-    List all postings.
+    List postings as plain column tuples (id, org_acronym, organization,
+    title, fetching_status, last_updated).
+
+    Projection variant of `list_postings` for display paths that only need a
+    few scalar columns: skips loading `description` and ORM instrumentation.
 
     Args:
         session (Session): SQLModel session for database operations.
         storage (StorageType): Storage type.
         limit (int): Maximum number of postings to return.
         status (FetchingStatus): Status of the postings.
+        after_id (Optional[int]): Keyset cursor, see `list_postings`.
     Returns:
-        Sequence[Posting]: List of postings.
+        Iterator[tuple]: Iterator over column tuples, fetched in server-side batches.
     """
     if session is None:
         raise ValueError("Session is required")
     if storage == StorageType.LOCAL:
-        query = select(Posting)
+        query = select(
+            Posting.id,
+            Posting.org_acronym,
+            Posting.organization,
+            Posting.title,
+            Posting.fetching_status,
+            Posting.last_updated,
+        ).order_by(Posting.id.desc())  # type: ignore[union-attr]
         if status is not None:
             query = query.where(Posting.fetching_status == status)
-        return session.exec(query.limit(limit)).all()
+        if after_id is not None:
+            query = query.where(Posting.id < after_id)
+        yield from session.exec(query.limit(limit).execution_options(yield_per=500))
     else:
         raise ValueError(f"Storage type {storage} not supported")
 
@@ -87,11 +167,22 @@ def is_posting_present(posting_id: int, session: Optional[Session] = None) -> bo
     """
     if session is None:
         raise ValueError("Session is required")
-    logger.debug(f"Checking if posting {posting_id} is present in the database")
-    result = session.exec(select(Posting).where(Posting.id == posting_id)).first()
-    logger.debug(f"Result: {'Found' if result is not None else 'Not found'}")
+    logger.debug("Checking if posting %s is present in the database", posting_id)
+    result = session.scalar(select(1).where(Posting.id == posting_id).limit(1))
+    logger.debug("Result: %s", "Found" if result is not None else "Not found")
     return result is not None
 
+@ensure_session
+def get_posting_ids(session: Optional[Session] = None) -> set[int]:
+    """
+    Get the ids of all postings as a set.
+    Loaded once by batch workflows so per-posting existence checks become
+    in-memory membership tests instead of one SELECT per posting.
+    """
+    if session is None:
+        raise ValueError("Session is required")
+    return set(session.exec(select(Posting.id)).all())
+
 @ensure_session
 def record_archive_entries(
     path: str, posting_id: int,
@@ -156,29 +247,47 @@ def create_zip_entries(
     Returns:
         List[ArchiveEntry]: List of created ArchiveEntry objects.
     """
-    entries: list[ArchiveEntry] = []
+    rows: list[dict] = []
+    parent_paths: list[str] = []
 
     with zipfile.ZipFile(zip_path) as zip_file:
-        for file_path in zip_file.namelist():
-            is_dir = file_path.endswith('/')
-            normalized_path = file_path.rstrip('/')
-            name = Path(normalized_path).name
-            parent_path = Path(normalized_path).parent
-            parent_entry = next((e for e in entries if e.path == str(parent_path)), None)
-            entry = ArchiveEntry(
-                name=name,
-                path=normalized_path,
-                parent_id=parent_entry.id if parent_entry else None,
-                posting_id=posting_id,
-                is_dir=is_dir,
-                is_extracted=False,
-            )
-            entries.append(entry)
+        for info in zip_file.infolist():
+            normalized_path = info.filename.rstrip('/')
+            # one C call instead of pathlib: no Path allocation per entry
+            parent_path, _, name = normalized_path.rpartition('/')
+            rows.append({
+                "name": name,
+                "path": normalized_path,
+                "parent_id": None,
+                "posting_id": posting_id,
+                "is_dir": info.is_dir(),
+                "is_extracted": False,
+            })
+            parent_paths.append(parent_path)
     if session is None:
         raise ValueError("Session is required")
-    session.add_all(entries)
-    session.commit()
-    return entries
+    if not rows:
+        return []
+    with writing_transaction(session):
+        result = session.execute(
+            insert(ArchiveEntry).values(rows).returning(ArchiveEntry.id, ArchiveEntry.path)
+        )
+        id_by_path = {path: entry_id for entry_id, path in result}
+        # ids are only known after the insert, so parent ids are resolved in a
+        # second executemany UPDATE over the path -> id index
+        parent_updates = [
+            {"entry_id": id_by_path[row["path"]], "parent": id_by_path[parent_path]}
+            for row, parent_path in zip(rows, parent_paths)
+            if parent_path in id_by_path
+        ]
+        if parent_updates:
+            session.connection().execute(
+                update(ArchiveEntry)
+                .where(ArchiveEntry.id == bindparam("entry_id"))
+                .values(parent_id=bindparam("parent")),
+                parent_updates,
+            )
+    return session.exec(select(ArchiveEntry).where(ArchiveEntry.id.in_(id_by_path.values()))).all()
 
 @ensure_session
 def update_posting_fetching_status(posting_id: int, status: FetchingStatus, session: Optional[Session] = None) -> None:
@@ -187,11 +296,13 @@ def update_posting_fetching_status(posting_id: int, status: FetchingStatus, sess
     """
     if session is None:
         raise ValueError("Session is required")
-    posting = session.exec(select(Posting).where(Posting.id == posting_id)).first()
-    if posting is None:
+    result = session.execute(
+        update(Posting).where(Posting.id == posting_id).values(fetching_status=status)
+    )
+    if result.rowcount == 0:
+        # release the write lock the no-op UPDATE took before bailing out
+        session.rollback()
         raise ValueError(f"Posting with id {posting_id} not found")
-    posting.fetching_status = status
-    session.add(posting)
     session.commit()
 
 @ensure_session
@@ -205,10 +316,11 @@ def remove_posting(posting_id: int | str, session: Optional[Session] = None) ->
     """
     if session is None:
         raise ValueError("Session is required")
-    posting = session.exec(select(Posting).where(Posting.id == posting_id)).first()
-    if posting is None:
+    result = session.execute(delete(Posting).where(Posting.id == posting_id))
+    if result.rowcount == 0:
+        # release the write lock the no-op DELETE took before bailing out
+        session.rollback()
         raise ValueError(f"Posting with id {posting_id} not found")
-    session.delete(posting)
     session.commit()
 
 @ensure_session
@@ -224,23 +336,30 @@ def get_pending_postings(session: Optional[Session] = None) -> Sequence[Posting]
 def get_pending_links(
     limit: Optional[int] = None,
     session: Optional[Session] = None,
-) -> Sequence[Sequence[Posting | PostingLink]]:
+) -> Sequence[Posting]:
     """
-    Get all pending links.
+    Get all postings that have pending links, with those links preloaded.
+
+    Each posting is materialized once and its pending links arrive in a
+    single follow-up IN query, instead of the old join that rebuilt the
+    same Posting for every one of its links. Callers iterate
+    `posting.links` directly.
 
     Args:
-        limit (int): Maximum number of links to return.
+        limit (int): Maximum number of postings to return.
         session (Session): SQLModel session for database operations.
 
     Returns:
-        Sequence[Sequence[Posting | PostingLink]]: List of postings and their links.
+        Sequence[Posting]: Postings whose `links` hold their pending links.
     """
     if session is None:
         raise ValueError("Session is required")
     query = (
-        select(Posting, PostingLink)
+        select(Posting)
         .join(PostingLink)
         .where(PostingLink.fetching_status == FetchingStatus.PENDING)
+        .distinct()
+        .options(selectinload(Posting.links.and_(PostingLink.fetching_status == FetchingStatus.PENDING)))
     )
     if limit is not None:
         query = query.limit(limit)
@@ -267,6 +386,25 @@ def record_archive_content(
         session.commit()
     return archive_content
 
+@ensure_session
+def record_archive_contents_bulk(
+    rows: list[dict],
+    session: Optional[Session] = None,
+) -> None:
+    """
+    Record a batch of archive contents in a single transaction.
+
+    Each row is a dict with `path`, `content`, `posting_id` and optionally
+    `entry_id`. One executemany INSERT under one commit replaces the
+    per-content commit (and its fsync) of `record_archive_content`.
+    """
+    if session is None:
+        raise ValueError("Session is required")
+    if not rows:
+        return
+    with writing_transaction(session):
+        session.execute(insert(ArchiveContent), rows)
+
 @ensure_session
 def get_archive_entry_from_filename(
     filename: str,
@@ -274,10 +412,15 @@ def get_archive_entry_from_filename(
 ) -> ArchiveEntry | None:
     """
     Get the archive entry from the filename.
+    Results are cached per session until the next write.
     """
     if session is None:
         raise ValueError("Session is required")
-    return session.exec(select(ArchiveEntry).where(ArchiveEntry.name == filename)).first()
+    cache = _lookup_cache(session)
+    key = ("archive_entry_name", filename)
+    if key not in cache:
+        cache[key] = session.exec(select(ArchiveEntry).where(ArchiveEntry.name == filename)).first()
+    return cache[key]
 
 @ensure_session
 def get_archive_content_from_path(
@@ -286,10 +429,15 @@ def get_archive_content_from_path(
 ) -> ArchiveContent | None:
     """
     Get the file content from the path.
+    Results are cached per session until the next write.
     """
     if session is None:
         raise ValueError("Session is required")
-    return session.exec(select(ArchiveContent).where(ArchiveContent.path == path)).first()
+    cache = _lookup_cache(session)
+    key = ("archive_content_path", path)
+    if key not in cache:
+        cache[key] = session.exec(select(ArchiveContent).where(ArchiveContent.path == path)).first()
+    return cache[key]
 
 @ensure_session
 def get_archive_content_by_id(
@@ -308,7 +456,7 @@ def get_archive_content_by_id(
     """
     if session is None:
         raise ValueError("Session is required")
-    return session.exec(select(ArchiveContent).where(ArchiveContent.id == id)).first()
+    return session.exec(_Q_ARCHIVE_CONTENT_BY_ID, params={"cid": id}).first()
 
 @ensure_session
 def paginate_archive_contents(
@@ -318,6 +466,9 @@ def paginate_archive_contents(
 ) -> Iterator[Sequence[ArchiveContent]]:
     """
     Paginate through all archive contents.
+    Batches are fetched with keyset pagination on the primary key
+    (`WHERE id > :last_id`), so each batch is an indexed range scan instead
+    of an OFFSET walk that re-reads all previously seen rows.
 
     Args:
         limit (Optional[int]): Maximum number of contents to return.
@@ -330,37 +481,46 @@ def paginate_archive_contents(
     if session is None:
         raise ValueError("Session is required")
     if limit is not None:
-        return session.exec(select(ArchiveContent).limit(limit)).all()
-    else:
-        pagination = 0
-        while True:
-            contents = session.exec(select(ArchiveContent).offset(pagination).limit(batch_size)).all()
-            if len(contents) == 0:
-                break
-            yield contents
-            pagination += batch_size
+        # previously this `return`ed a list out of a generator function,
+        # which silently never reached the caller; yield one capped batch
+        yield session.exec(select(ArchiveContent).order_by(ArchiveContent.id).limit(limit)).all()  # type: ignore[arg-type]
+        return
+    last_id = 0
+    query = (
+        select(ArchiveContent)
+        .where(ArchiveContent.id > bindparam("last_id"))
+        .order_by(ArchiveContent.id)  # type: ignore[arg-type]
+        .limit(batch_size)
+    )
+    while True:
+        contents = session.exec(query, params={"last_id": last_id}).all()
+        if len(contents) == 0:
+            break
+        yield contents
+        last_id = contents[-1].id
 
 @ensure_session
 def get_unprocessed_archive_contents(
     limit: Optional[int] = None,
     session: Optional[Session] = None,
-) -> Sequence[ArchiveContent]:
+) -> Iterator[ArchiveContent]:
     """
-    Get the unprocessed archive contents.
+    Get the unprocessed archive contents, streamed in driver-side batches
+    so large backlogs never materialize fully in memory.
 
     Args:
         limit (Optional[int]): Maximum number of contents to return.
         session (Session): SQLModel session for database operations.
 
     Returns:
-        Sequence[ArchiveContent]: List of unprocessed archive contents.
+        Iterator[ArchiveContent]: Iterator over unprocessed archive contents.
     """
     if session is None:
         raise ValueError("Session is required")
     query = select(ArchiveContent).where(not_(ArchiveContent.is_inference_done))
     if limit is not None:
         query = query.limit(limit)
-    return session.exec(query).all()
+    yield from session.exec(query.execution_options(yield_per=1000))
 
 
 @ensure_session
@@ -373,11 +533,13 @@ def set_archive_content_inference_done(
     """
     if session is None:
         raise ValueError("Session is required")
-    archive_content = session.exec(select(ArchiveContent).where(ArchiveContent.id == id)).first()
-    if archive_content is None:
+    result = session.execute(
+        update(ArchiveContent).where(ArchiveContent.id == id).values(is_inference_done=True)
+    )
+    if result.rowcount == 0:
+        # release the write lock the no-op UPDATE took before bailing out
+        session.rollback()
         raise ValueError(f"Archive content with id {id} not found")
-    archive_content.is_inference_done = True
-    session.add(archive_content)
     session.commit()
 
 @ensure_session
@@ -403,17 +565,22 @@ def insert_archive_labels(
     """
     if session is None:
         raise ValueError("Session is required")
-
-    for label_row in label_data:
-        session.add(ArchiveLabel(
-            archive_id=archive_id,
-            label=label_row["label"],
-            score=label_row["score"],
-            text=label_row["text"],
-            start_position=label_row["start"],
-            end_position=label_row["stop"],
-        ))
-    session.commit()
+    if not label_data:
+        return
+
+    rows = [
+        {
+            "archive_id": archive_id,
+            "label": label_row["label"],
+            "score": label_row["score"],
+            "text": label_row["text"],
+            "start_position": label_row["start"],
+            "end_position": label_row["stop"],
+        }
+        for label_row in label_data
+    ]
+    with writing_transaction(session):
+        session.execute(insert(ArchiveLabel), rows)
 
 @ensure_session
 def get_labels_from_metadata(
@@ -461,36 +628,58 @@ def update_archive_labels(
     """
     if session is None:
         raise ValueError("Session is required")
-    for label_row in label_data:
-        existing_labels = get_labels_from_metadata(
-            archive_id=archive_id,
-            label=label_row["label"],
-            start_position=label_row["start"],
-            end_position=label_row["stop"],
-            session=session,
-        )
-        if len(existing_labels) > 1:
-            logger.warning(f"Multiple labels found for {label_row['label']} at {label_row['start']}-{label_row['stop']}. Label instances should be unique.")
-        if existing_labels:
-            logger.info(f"Found {len(existing_labels)} labels for {label_row['label']} at {label_row['start']}-{label_row['stop']}, updating")
-            for label in existing_labels:
-                label.score = label_row["score"] # TODO: add a check to see if the score is the same as the existing score
-                label.text = label_row["text"] # TODO: add a check to see if the text is the same as the existing text
-                label.start_position = label_row["start"] # TODO: add a check to see if the start position is the same as the existing start position
-                label.end_position = label_row["stop"] # TODO: add a check to see if the end position is the same as the existing end position
-                label.updated_at = datetime.now()
-                session.add(label)
-        else:
-            logger.info(f"No labels found for {label_row['label']} at {label_row['start']}-{label_row['stop']}, inserting")
-            session.add(ArchiveLabel(
-                archive_id=archive_id,
-                label=label_row["label"],
-                score=label_row["score"],
-                text=label_row["text"],
-                start_position=label_row["start"],
-                end_position=label_row["stop"],
-            ))
-    session.commit()
+    if not label_data:
+        return
+    # BEGIN IMMEDIATE: the prefetch SELECT is write intent, so take the write
+    # lock up front instead of upgrading a SHARED lock at the first UPDATE
+    with writing_transaction(session):
+        # one SELECT over all incoming keys instead of one per label row
+        keys = [(label_row["label"], label_row["start"], label_row["stop"]) for label_row in label_data]
+        existing = session.exec(
+            select(ArchiveLabel).where(
+                ArchiveLabel.archive_id == archive_id,
+                tuple_(ArchiveLabel.label, ArchiveLabel.start_position, ArchiveLabel.end_position).in_(keys),
+            )
+        ).all()
+        by_key: dict[tuple, list[ArchiveLabel]] = {}
+        for label in existing:
+            by_key.setdefault((label.label, label.start_position, label.end_position), []).append(label)
+
+        now = datetime.now()
+        update_rows: list[dict] = []
+        insert_rows: list[dict] = []
+        for label_row in label_data:
+            key = (label_row["label"], label_row["start"], label_row["stop"])
+            existing_labels = by_key.get(key, [])
+            if len(existing_labels) > 1:
+                logger.warning(f"Multiple labels found for {label_row['label']} at {label_row['start']}-{label_row['stop']}. Label instances should be unique.")
+            if existing_labels:
+                for label in existing_labels:
+                    update_rows.append({
+                        "b_id": label.id,
+                        "b_score": label_row["score"],
+                        "b_text": label_row["text"],
+                        "b_updated_at": now,
+                    })
+            else:
+                insert_rows.append({
+                    "archive_id": archive_id,
+                    "label": label_row["label"],
+                    "score": label_row["score"],
+                    "text": label_row["text"],
+                    "start_position": label_row["start"],
+                    "end_position": label_row["stop"],
+                })
+        if update_rows:
+            session.connection().execute(
+                update(ArchiveLabel)
+                .where(ArchiveLabel.id == bindparam("b_id"))
+                .values(score=bindparam("b_score"), text=bindparam("b_text"), updated_at=bindparam("b_updated_at")),
+                update_rows,
+            )
+        if insert_rows:
+            session.execute(insert(ArchiveLabel), insert_rows)
+    logger.info(f"Updated {len(update_rows)} and inserted {len(insert_rows)} labels for archive {archive_id}")
 
 @ensure_session
 def upsert_archive_labels(
@@ -499,8 +688,10 @@ def upsert_archive_labels(
     session: Optional[Session] = None,
 ) -> None:
     """
-    Upsert archive labels. If the archive content has any existing labels, calls the update function.
-    Otherwise, calls the insert function. Further optimization might be performed at a later stage.
+    Upsert archive labels in a single statement.
+    Relies on the (archive_id, label, start_position, end_position) unique
+    key: new rows are inserted, existing ones get their score, text and
+    updated_at refreshed via `INSERT ... ON CONFLICT DO UPDATE`.
 
     Args:
         archive_id (int): The ID of the archive.
@@ -509,7 +700,24 @@ def upsert_archive_labels(
     """
     if session is None:
         raise ValueError("Session is required")
-    if exists_labels_for_archive(archive_id, session):
-        update_archive_labels(archive_id, label_data, session)
-    else:
-        insert_archive_labels(archive_id, label_data, session)
\ No newline at end of file
+    if not label_data:
+        return
+    rows = [
+        {
+            "archive_id": archive_id,
+            "label": label_row["label"],
+            "score": label_row["score"],
+            "text": label_row["text"],
+            "start_position": label_row["start"],
+            "end_position": label_row["stop"],
+        }
+        for label_row in label_data
+    ]
+    now = datetime.now()
+    statement = sqlite_insert(ArchiveLabel).values(rows)
+    statement = statement.on_conflict_do_update(
+        index_elements=["archive_id", "label", "start_position", "end_position"],
+        set_={"score": statement.excluded.score, "text": statement.excluded.text, "updated_at": now},
+    )
+    with writing_transaction(session):
+        session.execute(statement)
\ No newline at end of file
@@ -1,38 +1,116 @@
 from sqlmodel import create_engine, Session, SQLModel
+from sqlalchemy import event
 from sqlalchemy.engine import Engine
+from sqlalchemy.orm import sessionmaker
 
 import os
-from typing import Tuple
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Iterator, Tuple
 
 import logging
 
 logger = logging.getLogger(__name__)
 
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+"""WAL keeps readers from blocking writers and synchronous=NORMAL drops the
+per-commit fsync; the remaining pragmas trade a bit of memory for fewer disk
+round-trips."""
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """
+    Apply the tuning PRAGMAs on every new SQLite connection.
+    """
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+@lru_cache(maxsize=None)
+def get_engine(db_path: str, echo: bool = False) -> Engine:
+    """
+    Create (or return the cached) engine for the given database path.
+    Caching keeps a single connection pool per database instead of paying
+    pool setup and PRAGMA replay on every `connect_to_db` call.
+    """
+    engine = create_engine(
+        f"sqlite:///{db_path}",
+        echo=echo,
+        insertmanyvalues_page_size=1000,
+        query_cache_size=1200,
+        connect_args={"check_same_thread": False},
+    )
+    event.listen(engine, "connect", _set_sqlite_pragmas)
+    return engine
+
+@lru_cache(maxsize=None)
+def get_session_factory(db_path: str, echo: bool = False) -> sessionmaker:
+    """
+    Return the cached session factory bound to the engine for `db_path`.
+    `expire_on_commit=False` keeps committed instances usable without a
+    re-SELECT on the next attribute access.
+    """
+    return sessionmaker(bind=get_engine(db_path, echo), class_=Session, expire_on_commit=False)
+
+@contextmanager
+def writing_transaction(session: Session) -> Iterator[Session]:
+    """
+    Run a write-intent block under an explicit `BEGIN IMMEDIATE` transaction.
+
+    SQLite's default deferred transaction takes a SHARED lock on the first
+    SELECT and only upgrades it at the first write, which can fail with
+    SQLITE_BUSY under contention. Taking the write lock up front lets
+    multi-statement writers serialize cleanly instead of retrying. Commits
+    on success, rolls back on error.
+    """
+    session.connection().exec_driver_sql("BEGIN IMMEDIATE")
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+
 def connect_to_db(echo: bool = False) -> Tuple[Engine, Session]:
     """
     Connect to the local SQLite database using a path from the LOCAL_DB_PATH environment variable if set.
+    The underlying engine and session factory are process-wide singletons per
+    database path; only the session is created per call.
 
     Returns:
         Tuple[Engine, Session]: A tuple containing the SQLAlchemy engine and session.
     """
     db_path = os.environ.get("LOCAL_DB_PATH", "openplace.db")
-    logger.info(f"Connecting to SQLite database at path: {db_path}")
+    logger.debug(f"Connecting to SQLite database at path: {db_path}")
     try:
-        engine = create_engine(f"sqlite:///{db_path}", echo=echo)
-        session = Session(engine)
-        logger.info("Successfully connected to the SQLite database.")
+        engine = get_engine(db_path, echo)
+        session = get_session_factory(db_path, echo)()
         return engine, session
     except Exception as e:
         logger.error(f"Failed to connect to the SQLite database at {db_path}: {e}", exc_info=True)
         raise
 
+_initialized_engines: set[Engine] = set()
+"""Engines whose schema has already been created this process; workflows call
+`create_tables` on every entry point, so the DDL round-trips run only once."""
+
 def create_tables(engine: Engine):
     """
-    Create all tables in the database.
+    Create all tables in the database. No-op after the first call per engine:
+    `create_all` is idempotent but still probes the catalog for every table
+    on each call.
     """
+    if engine in _initialized_engines:
+        return
     try:
         SQLModel.metadata.create_all(engine)
-        # TODO: add a check to see if the tables already exist, avoid logging a create if they exist
+        _initialized_engines.add(engine)
         logger.info("Successfully created all tables in the SQLite database.")
     except Exception as e:
         logger.error(f"Failed to create all tables in the SQLite database: {e}", exc_info=True)
@@ -1,21 +1,63 @@
 import logging
+import os
+import re
 import duckdb
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
 from duckdb import DuckDBPyConnection as Connection
 
 logger = logging.getLogger(__name__)
 
+_IDENTIFIER_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+VALID_COMPRESSIONS = ("gzip", "zstd", "none")
+
+DATE_PARAGRAPH_PATTERN = r'\d+[/\-\.]\d+[/\-\.]\d+'
+"""DuckDB-side mirror of the extract module's DATE_REGEX."""
+
+def _date_paragraphs_select(source: str) -> str:
+    """
+    Build a projection keeping only the date-bearing paragraphs of each
+    content row. Running the split + regex inside DuckDB's vectorized
+    engine is far cheaper than looping over paragraphs in Python after
+    the export.
+    """
+    return (
+        "SELECT posting_id, path, "
+        "list_filter(string_split(content, chr(10) || chr(10)), "
+        f"p -> regexp_matches(p, '{DATE_PARAGRAPH_PATTERN}')) AS date_paragraphs "
+        f"FROM {source}"
+    )
+
+def _quote_literal(value: str) -> str:
+    """
+    Quote a string for safe inclusion in a DuckDB statement where bound
+    parameters are not accepted (e.g. COPY targets and ATTACH paths).
+    """
+    return "'" + value.replace("'", "''") + "'"
+
+def _check_identifier(name: str) -> str:
+    """
+    Validate a table name before interpolating it into a query.
+    """
+    if not _IDENTIFIER_RE.match(name):
+        raise ValueError(f"Invalid table name: {name}")
+    return name
+
+@lru_cache(maxsize=None)
 def connect_to_database(db_path: str = "openplace.db") -> Connection:
     """
     Connect to the duckdb database.
+    Cached per database path, mirroring the engine cache in
+    storage.local.settings: the sqlite extension install/load and the
+    ATTACH only happen once per process.
     """
     con = duckdb.connect(":memory:")
     con.install_extension("sqlite")
     con.load_extension("sqlite")
 
-    con.execute(f"""ATTACH '{db_path}' AS openplace (TYPE sqlite);""")
+    con.execute(f"ATTACH {_quote_literal(db_path)} AS openplace (TYPE sqlite);")
     con.execute("USE openplace;")
     return con
 
@@ -26,26 +68,87 @@ def sqlite_export(
     output_format: str = "parquet",
     compression: str = "gzip",
     use_date_in_filename: bool = False,
+    db_path: str = "openplace.db",
+    dates_only: bool = False,
+    split_output: bool = False,
 ) -> None:
     """
     Export the given table to the given directory.
+    Rows are read with `sqlite_scan` straight from the SQLite file, which
+    skips the ATTACH database registration and lets DuckDB parallelize the
+    scan and the writer. The table name is validated and the output path and
+    compression are quoted, so paths containing quotes no longer break the
+    COPY statement.
+
+    With `split_output` (parquet only), the writer emits one part file per
+    thread into a `{filename}/` directory instead of a single file, which
+    bounds the writer's buffer memory on very large tables and lets the
+    threads write independently; DuckDB, pandas and polars all read Parquet
+    directories transparently.
     """
+    table_name = _check_identifier(table_name)
+    if compression not in VALID_COMPRESSIONS:
+        raise ValueError(f"Invalid compression: {compression}")
+    if output_format not in ("parquet", "jsonl", "csv"):
+        raise ValueError(f"Invalid output format: {output_format}")
     date = datetime.now().strftime("%Y-%m-%d") if use_date_in_filename else ""
     filename = f"archives-{date}" if use_date_in_filename else "archives"
-    match output_format:
-        case "parquet":
-            con.execute(f"COPY (SELECT * FROM {table_name}) TO '{output_dir}/{filename}.parquet' (FORMAT 'parquet')")
-            logger.info(f"Exported {table_name} to {output_dir}/{filename}.parquet")
-        case "jsonl":
-            con.execute(f"COPY (SELECT * FROM {table_name}) TO '{output_dir}/{filename}.jsonl' (FORMAT 'jsonl', COMPRESSION '{compression}')")
-            logger.info(f"Exported {table_name} to {output_dir}/{filename}.jsonl.gz")
-        case "csv":
-            con.execute(f"COPY (SELECT * FROM {table_name}) TO '{output_dir}/{filename}.csv' (FORMAT 'csv', HEADER true, COMPRESSION '{compression}')")
-            logger.info(f"Exported {table_name} to {output_dir}/{filename}.csv.gz")
-        case _:
-            raise ValueError(f"Invalid output format: {output_format}")
+    source = f"sqlite_scan({_quote_literal(db_path)}, {_quote_literal(table_name)})"
+    inner = _date_paragraphs_select(source) if dates_only else f"SELECT * FROM {source}"
+    # materialize once into DuckDB's native columnar storage: the row-to-
+    # column conversion out of SQLite happens a single time up front, and
+    # the writer then streams native vectors instead of pulling rows
+    # through the SQLite cursor mid-COPY
+    con.execute(f"CREATE OR REPLACE TEMP TABLE _export AS {inner}")
+    try:
+        match output_format:
+            case "parquet" if split_output:
+                target = _quote_literal(f"{output_dir}/{filename}")
+                con.execute(f"COPY _export TO {target} (FORMAT 'parquet', COMPRESSION 'zstd', COMPRESSION_LEVEL 3, ROW_GROUP_SIZE 100000, PER_THREAD_OUTPUT true)")
+                logger.info(f"Exported {table_name} to {output_dir}/{filename}/ (one part file per thread)")
+            case "parquet":
+                target = _quote_literal(f"{output_dir}/{filename}.parquet")
+                # zstd + large row groups beat gzip on both size and encode speed for columnar data
+                con.execute(f"COPY _export TO {target} (FORMAT 'parquet', COMPRESSION 'zstd', ROW_GROUP_SIZE 100000)")
+                logger.info(f"Exported {table_name} to {output_dir}/{filename}.parquet")
+            case "jsonl":
+                target = _quote_literal(f"{output_dir}/{filename}.jsonl")
+                con.execute(f"COPY _export TO {target} (FORMAT 'jsonl', COMPRESSION '{compression}')")
+                logger.info(f"Exported {table_name} to {output_dir}/{filename}.jsonl.gz")
+            case "csv":
+                target = _quote_literal(f"{output_dir}/{filename}.csv")
+                con.execute(f"COPY _export TO {target} (FORMAT 'csv', HEADER true, COMPRESSION '{compression}')")
+                logger.info(f"Exported {table_name} to {output_dir}/{filename}.csv.gz")
+            case _:
+                raise ValueError(f"Invalid output format: {output_format}")
+    finally:
+        con.execute("DROP TABLE IF EXISTS _export")
+
+def export_unprocessed_contents(output_path: str, limit: Optional[int] = None, db_path: str = "openplace.db") -> str:
+    """
+    Export unprocessed archive contents to a single Parquet file.
+    One columnar file compresses repetitive markdown well and avoids the
+    filesystem churn of writing one .txt file per content row.
 
-def export_archives(output_dir: str = ".", output_format: str = "parquet", compression: str = "gzip", use_date_in_filename: bool = False) -> str:
+    Args:
+        output_path: Path of the Parquet file to write.
+        limit: Maximum number of contents to export (all if None).
+        db_path: Path to the SQLite database to export from.
+    Returns:
+        The path to the exported file.
+    """
+    con = connect_to_database(db_path)
+    limit_clause = f" LIMIT {int(limit)}" if limit is not None else ""
+    con.execute(
+        f"COPY (SELECT id, posting_id, path, content FROM archivecontent "
+        f"WHERE NOT is_inference_done{limit_clause}) "
+        f"TO {_quote_literal(output_path)} (FORMAT 'parquet', COMPRESSION 'zstd')"
+    )
+    # the connection is a cached per-path singleton, so it stays open
+    logger.info(f"Exported unprocessed archive contents to {output_path}")
+    return output_path
+
+def export_archives(output_dir: str = ".", output_format: str = "parquet", compression: str = "gzip", use_date_in_filename: bool = False, dates_only: bool = False, split_output: bool = False) -> str:
     """
     Export the archives from the database.
     If no output directory is provided, the archives will be exported to a file named "archives.parquet" in the current directory.
@@ -55,11 +158,19 @@ def export_archives(output_dir: str = ".", output_format: str = "parquet", compr
         output_dir: The directory to export the archives to.
         output_format: The format to export the archives to.
         compression: The compression to use (only supported for jsonl and csv)
+        dates_only: Export only the date-bearing paragraphs of each content, filtered inside DuckDB.
+        split_output: Write one Parquet part file per writer thread into a directory (parquet only).
     Returns:
         The path to the exported file.
     """
     logger.info(f"Exporting archives to {output_dir} in {output_format} format")
-    con = connect_to_database()
-    sqlite_export(con, output_dir, "archivecontent", output_format, compression, use_date_in_filename)
+    # sqlite_scan reads the SQLite file directly, so no ATTACH is needed;
+    # all cores go to DuckDB's scan and writer threads
+    con = duckdb.connect(":memory:")
+    con.install_extension("sqlite")
+    con.load_extension("sqlite")
+    con.execute(f"SET threads TO {os.cpu_count()}")
+    db_path = os.environ.get("LOCAL_DB_PATH", "openplace.db")
+    sqlite_export(con, output_dir, "archivecontent", output_format, compression, use_date_in_filename, db_path=db_path, dates_only=dates_only, split_output=split_output)
     con.close()
     return output_dir
\ No newline at end of file
@@ -1,7 +1,7 @@
 from typing import Iterable, Callable
-from unidecode import unidecode
-import re
+from unidecode import unidecode_expect_ascii as unidecode
 from openplace.storage.local.models import ArchiveContent
+from openplace.tasks.extract.utils import collapse_dots, get_content, iter_paragraphs
 
 Cleaner = Callable[[str], str]
 """Type alias for a function that cleans a string."""
@@ -10,8 +10,7 @@ def normalize_text(text: str) -> str:
     """
     Normalize the given text by removing newlines and unidecoding.
     """
-    text_no_dots = re.sub(r'\.\.+', '.', text)
-    return unidecode(text_no_dots.replace("\n", " "))
+    return unidecode(collapse_dots(text).replace("\n", " "))
 
 
 def heading_cleaner(text: str) -> str:
@@ -28,16 +27,9 @@ def clean_each_paragraph(
         item (ArchiveContent | str): The item to clean.
         cleaner (Cleaner): The cleaner function to use.
     """
-    content = (
-        item.content if isinstance(item, ArchiveContent) 
-        else item if isinstance(item, str) else None
-    )
-
-    if content is None:
-        raise ValueError(f"Invalid item type: {type(item)}")
-    
-    lines = content.split("\n\n") # prefer splitting by paragraphs (= \n\n)
-    for line in lines:
+    content = get_content(item)
+
+    for line in iter_paragraphs(content): # prefer splitting by paragraphs (= \n\n)
         normalized_line = normalize_text(line)
         yield cleaner(normalized_line)
 
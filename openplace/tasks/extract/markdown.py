@@ -1,7 +1,7 @@
 import os
 from markitdown import MarkItDown
 from pathlib import Path
-import asyncio
+from concurrent.futures import ProcessPoolExecutor
 import logging
 from openplace.storage.local import queries as q
 from openplace.tasks.store.writers import parse_archive_name
@@ -11,46 +11,91 @@ md = MarkItDown()
 
 logger = logging.getLogger(__name__)
 
+BATCH_MAX_ROWS = 256
+BATCH_MAX_BYTES = 64 * 1024 * 1024
+"""Flush the content buffer at 256 archives or 64 MB, whichever comes first."""
+
+# per-worker converter: built once by the pool initializer so each task
+# does not pay MarkItDown construction
+_worker_md: MarkItDown | None = None
+
+def _init_worker() -> None:
+    global _worker_md
+    _worker_md = MarkItDown()
+
 def find_archive_paths(directory: str) -> list[Path]:
     """
     Find all archive paths in the given directory.
     """
     return list(Path(directory).glob('*.zip'))
 
-async def extract_markdown(archive_path: Path, persist: bool = True) -> ArchiveContent | None:
+def _convert_one(archive_path: Path) -> tuple[str, ArchiveContent]:
     """
-    Extract the markdown from the given archive path and record the content in the database.
+    Convert a single archive to markdown. Runs in a worker process; the
+    database write happens in the parent so workers stay connection-free.
+    Returns the archive file name (the persisted path) with the content.
     """
     # TODO: do not read XML or boil it down to a few lines of text
     logger.info(f"Extracting markdown from {archive_path}")
     posting_id, filename, file_type = parse_archive_name(archive_path.name)
-    archive_content = md.convert(archive_path).markdown
-
-    if persist:
-        q.record_archive_content(
-            path=archive_path.name,
-            content=archive_content,
-            posting_id=posting_id,
-        )
-    return ArchiveContent(
+    converter = _worker_md if _worker_md is not None else md
+    archive_content = converter.convert(archive_path).markdown
+    return archive_path.name, ArchiveContent(
         posting_id=posting_id,
         filename=filename,
         file_type=file_type,
         content=archive_content,
     )
 
-async def extract_all_archives(directory: str) -> list[ArchiveContent]:
+def extract_markdown(archive_path: Path, persist: bool = True) -> ArchiveContent | None:
     """
-    Extract the markdown from all archives in the given directory.
+    Extract the markdown from the given archive path and record the content in the database.
     """
-    # TODO: test async extraction performance
-    archive_paths = find_archive_paths(directory)
-
-    futures = [asyncio.create_task(extract_markdown(archive_path)) for archive_path in archive_paths]
-    return [result for result in await asyncio.gather(*futures) if result is not None]
+    archive_name, content = _convert_one(archive_path)
+    if persist:
+        q.record_archive_content(
+            path=archive_name,
+            content=content.content,
+            posting_id=content.posting_id,
+        )
+    return content
 
-def extract_all_archives_concurrently(directory: str) -> list[ArchiveContent]:
+def extract_all_archives_concurrently(directory: str, persist: bool = True) -> list[ArchiveContent]:
     """
     Extract the markdown from all archives in the given directory.
+
+    MarkItDown conversion is CPU-bound (PDF/DOCX parsing in-process), so the
+    archives are spread over a process pool; the previous asyncio version ran
+    every conversion serially on the event loop. Contents are persisted from
+    the parent process as results stream back.
     """
-    return asyncio.run(extract_all_archives(directory))
\ No newline at end of file
+    archive_paths = find_archive_paths(directory)
+    if not archive_paths:
+        return []
+
+    results: list[ArchiveContent] = []
+    # one bulk INSERT per batch instead of one commit (and fsync) per archive
+    pending_rows: list[dict] = []
+    pending_bytes = 0
+
+    def flush() -> None:
+        nonlocal pending_bytes
+        q.record_archive_contents_bulk(pending_rows)
+        pending_rows.clear()
+        pending_bytes = 0
+
+    with ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=_init_worker) as executor:
+        for archive_name, content in executor.map(_convert_one, archive_paths, chunksize=4):
+            if persist:
+                pending_rows.append({
+                    "path": archive_name,
+                    "content": content.content,
+                    "posting_id": content.posting_id,
+                })
+                pending_bytes += len(content.content)
+                if len(pending_rows) >= BATCH_MAX_ROWS or pending_bytes >= BATCH_MAX_BYTES:
+                    flush()
+            results.append(content)
+    if pending_rows:
+        flush()
+    return results
@@ -2,25 +2,28 @@ import re
 from enum import Enum
 
 class FileExtensionPattern(Enum):
-    """Patterns linked to different file extensions."""
-    PDF = re.compile(r'\.pdf$', re.IGNORECASE)
-    DOCX = re.compile(r'\.docx$', re.IGNORECASE)
-    DOC = re.compile(r'\.doc$', re.IGNORECASE)
-    XLSX = re.compile(r'\.xlsx$', re.IGNORECASE)
-    XLS = re.compile(r'\.xls$', re.IGNORECASE)
-    CSV = re.compile(r'\.csv$', re.IGNORECASE)
-    TXT = re.compile(r'\.txt$', re.IGNORECASE)
-    ZIP = re.compile(r'\.zip$', re.IGNORECASE)
-    RAR = re.compile(r'\.rar$', re.IGNORECASE)
-    GZ = re.compile(r'\.gz$', re.IGNORECASE)
-    BZ2 = re.compile(r'\.bz2$', re.IGNORECASE)
-    XZ = re.compile(r'\.xz$', re.IGNORECASE)
-    LZMA = re.compile(r'\.lzma$', re.IGNORECASE)
-    LZ = re.compile(r'\.lz$', re.IGNORECASE)
-    PARQUET = re.compile(r'\.parquet$', re.IGNORECASE)
+    """File extension suffixes; a plain endswith beats a regex pass per check."""
+    PDF = '.pdf'
+    DOCX = '.docx'
+    DOC = '.doc'
+    XLSX = '.xlsx'
+    XLS = '.xls'
+    CSV = '.csv'
+    TXT = '.txt'
+    ZIP = '.zip'
+    RAR = '.rar'
+    GZ = '.gz'
+    BZ2 = '.bz2'
+    XZ = '.xz'
+    LZMA = '.lzma'
+    LZ = '.lz'
+    PARQUET = '.parquet'
 
     def __call__(self, text: str) -> bool:
-        return self.value.match(text) is not None
+        return text.lower().endswith(self.value)
+
+EXT_MAP = {pattern.value: pattern for pattern in FileExtensionPattern}
+"""Extension -> pattern lookup, e.g. EXT_MAP.get(os.path.splitext(name)[1].lower())."""
 
 class FileStructurePattern(Enum):
     """Patterns linked to different file headings."""
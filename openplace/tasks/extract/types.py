@@ -1,11 +1,13 @@
-from dataclasses import dataclass, asdict
-from unidecode import unidecode
+from dataclasses import dataclass
+from unidecode import unidecode_expect_ascii as unidecode
 from typing import Type
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DateContent:
     """
     A dataclass representing the piece of content which contains a date (within a document).
+    Slotted and frozen: thousands of instances per archive, no per-instance
+    __dict__, and hashability for dedup.
     """
     content: str
     index: int
@@ -13,12 +15,16 @@ class DateContent:
 
     def __str__(self) -> str:
         return unidecode(self.content)
-    
+
     def __repr__(self) -> str:
         return f"DateContent(content={self.content}, index={self.index}, length={self.length})"
-    
+
     def to_json(self) -> dict:
-        return asdict(self)
+        return {
+            "content": self.content,
+            "index": self.index,
+            "length": self.length,
+        }
     
     @classmethod
     def from_json(cls: Type["DateContent"], data: dict) -> "DateContent":
@@ -28,7 +34,7 @@ class DateContent:
             length=data["length"],
         )
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DateContext:
     """
     A dataclass representing date information and its surrounding context (within a document).
@@ -57,6 +63,8 @@ class DateContext:
     
     @classmethod
     def from_json(cls: Type["DateContext"], data: dict) -> "DateContext":
+        # for deserializing external JSON, where re-unidecoding is a safety
+        # net; in-process code should construct DateContext directly
         return cls(
             content=unidecode(data["content"]),
             index=data["index"],
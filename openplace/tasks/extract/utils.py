@@ -1,7 +1,12 @@
 import re
-from typing import Iterable
+from collections import deque
+from functools import lru_cache
+from itertools import islice
+from typing import Iterable, Iterator
 from dateutil.parser import parse
-from unidecode import unidecode
+# expect_ascii tries a plain ascii encode first and only falls back to the
+# per-character table walk for non-ASCII input
+from unidecode import unidecode_expect_ascii as unidecode
 from openplace.storage.local.models import ArchiveContent
 from openplace.tasks.extract.types import DateContext
 
@@ -14,6 +19,70 @@ PAGE_COUNT_REGEX = r'^(\d+) *[\/\-\|] *(\d+)'
 PAGE_LITERAL_COUNT_REGEX = r'^[Pp][Aa][Gg][Ee] *(\d+) [Ss][Uu][Rr] *(\d+)'
 IDENTIFIER_REGEX = r'^[A-Z0-9]+[\_\-]?[A-Z0-9]+$'
 
+# compiled once at import: the predicates below run on every paragraph of
+# every archive, so we skip the re-module cache lookup on each call
+_SINGLE_NUMBER_RE = re.compile(SINGLE_NUMBER_REGEX)
+_DATE_RE = re.compile(DATE_REGEX)
+_LETTER_SECTION_RE = re.compile(LETTER_SECTION_REGEX)
+_SUBSECTION_RE = re.compile(SUBSECTION_REGEX)
+_SECTION_LITERAL_RE = re.compile(SECTION_LITERAL_REGEX)
+_PAGE_COUNT_RE = re.compile(PAGE_COUNT_REGEX)
+_PAGE_LITERAL_COUNT_RE = re.compile(PAGE_LITERAL_COUNT_REGEX)
+_IDENTIFIER_RE = re.compile(IDENTIFIER_REGEX)
+
+# single alternation over every "not a dated paragraph" shape: one engine
+# pass replaces the 5-8 separate matches str_has_date used to run per line
+_SKIP_RE = re.compile(
+    "|".join(
+        f"(?:{pattern})"
+        for pattern in (
+            LETTER_SECTION_REGEX,
+            SUBSECTION_REGEX,
+            SECTION_LITERAL_REGEX,
+            PAGE_COUNT_REGEX,
+            PAGE_LITERAL_COUNT_REGEX,
+            SINGLE_NUMBER_REGEX,
+            IDENTIFIER_REGEX,
+            r'\#\# File: ',
+            r'Content from the zip file',
+        )
+    )
+)
+
+def collapse_dots(text: str) -> str:
+    """
+    Collapse runs of dots ('...' leaders and the like) to a single dot.
+    Each pass is a C-level find+copy, which beats entering the regex engine
+    for this fixed-literal substitution; the loop halves the longest run per
+    pass, so it terminates in O(log max_run) passes.
+    """
+    while '..' in text:
+        text = text.replace('..', '.')
+    return text
+
+def get_content(item: ArchiveContent | str) -> str:
+    """
+    Return the text content of the given item (ArchiveContent or plain str).
+    Grabbing the attribute first keeps the hot ArchiveContent path free of
+    isinstance checks.
+    """
+    content = getattr(item, "content", item)
+    if not isinstance(content, str):
+        raise ValueError(f"Invalid item type: {type(item)}")
+    return content
+
+def iter_paragraphs(content: str) -> Iterator[str]:
+    """
+    Yield the paragraphs (chunks separated by blank lines) of the given
+    content one at a time, without materializing the full list the way
+    `content.split("\\n\\n")` does.
+    """
+    start = 0
+    while (end := content.find("\n\n", start)) != -1:
+        yield content[start:end]
+        start = end + 2
+    yield content[start:]
+
 def is_zip_file_header(text: str) -> bool:
     """
     Check if the given text is a zip file header.
@@ -28,38 +97,44 @@ def is_section(text: str) -> bool:
     Check if the given text is a section.
     """
     return (
-        re.match(LETTER_SECTION_REGEX, text) is not None or
-        re.match(SUBSECTION_REGEX, text) is not None or
-        re.match(SECTION_LITERAL_REGEX, text) is not None
+        _LETTER_SECTION_RE.match(text) is not None or
+        _SUBSECTION_RE.match(text) is not None or
+        _SECTION_LITERAL_RE.match(text) is not None
     )
 
 def is_identifier(text: str) -> bool:
     """
     Check if the given text is an identifier.
     """
-    return re.match(IDENTIFIER_REGEX, text) is not None
+    return _IDENTIFIER_RE.match(text) is not None
 
 def is_page_count(text: str) -> bool:
     """
     Check if the given text is a page count.
     """
     return (
-        re.match(PAGE_COUNT_REGEX, text) is not None or
-        re.match(PAGE_LITERAL_COUNT_REGEX, text) is not None
+        _PAGE_COUNT_RE.match(text) is not None or
+        _PAGE_LITERAL_COUNT_RE.match(text) is not None
     )
 
 def is_single_number(text: str) -> bool:
     """
     Check if the given text is a single number.
     """
-    return re.match(SINGLE_NUMBER_REGEX, text) is not None
+    return _SINGLE_NUMBER_RE.match(text) is not None
 
+@lru_cache(maxsize=4096)
 def clean_text(text: str) -> str:
     """
     Clean the given text by removing newlines and unidecoding.
-    """
-    text_no_dots = re.sub(r'\.\.+', '.', text)
-    return unidecode(text_no_dots.replace("\n", " "))
+    Memoized: archives repeat boilerplate paragraphs (headers, footers,
+    \"## File:\" declarations), and both the regex and unidecode are pure.
+    """
+    flat = collapse_dots(text).replace("\n", " ")
+    # most paragraphs are pure ASCII already; skip unidecode entirely then
+    if flat.isascii():
+        return flat
+    return unidecode(flat)
     
 def clean_context(context: list[str]) -> str:
     """
@@ -77,24 +152,27 @@ def word_has_date(text: str) -> bool:
     Returns:
         bool: True if a date is found, False otherwise.
     """
+    # dateutil's fuzzy parse is exception-driven and by far the dominant cost
+    # here, so only invoke it when a date-shaped substring is present
+    if not _DATE_RE.search(text):
+        return False
     try:
         parse(text, fuzzy=True)
         return True
-    except Exception:
+    except (ValueError, OverflowError, TypeError):
         return False
 
+@lru_cache(maxsize=8192)
 def str_has_date(text: str) -> bool:
     """
     Check if the given text contains a date matching the DATE_REGEX pattern.
+    Memoized for the same reason as `clean_text`: boilerplate lines are
+    tested over and over across archives.
     """
-    if any(
-        [
-            is_section(text),
-            is_page_count(text),
-            is_single_number(text),
-            is_zip_file_header(text),
-            is_identifier(text),
-        ]):
+    if _SKIP_RE.match(text):
+        return False
+    # one line-level scan skips the per-word loop for date-free paragraphs
+    if not _DATE_RE.search(text):
         return False
     return any(word_has_date(word) for word in text.split())
 
@@ -120,12 +198,7 @@ def has_date(item: ArchiveContent | str) -> bool:
     Returns:
         bool: True if a date is found in the item, False otherwise.
     """
-    if isinstance(item, ArchiveContent):
-        return archive_content_has_date(item)
-    elif isinstance(item, str):
-        return str_has_date(item)
-    else:
-        raise ValueError(f"Invalid item type: {type(item)}")
+    return str_has_date(get_content(item))
 
 def context_relevant_lines(
     item: ArchiveContent | str, window_size: int = 5,
@@ -139,29 +212,32 @@ def context_relevant_lines(
         window_size (int): The number of lines to retrieve before and after the date.
     """
     num_context_lines = (window_size - 1) // 2 # half before, half after
-    content = (
-        item.content if isinstance(item, ArchiveContent) 
-        else item if isinstance(item, str) else None
-    )
+    content = get_content(item)
 
-    if content is None:
-        raise ValueError(f"Invalid item type: {type(item)}")
-    
-    lines = content.split("\n\n") # prefer splitting by paragraphs (= \n\n)
-    for i, line in enumerate(lines):
+
+    # stream paragraph by paragraph with rolling windows: memory stays at
+    # O(window) instead of the full paragraph list, and no per-hit slicing
+    paragraphs = iter_paragraphs(content) # prefer splitting by paragraphs (= \n\n)
+    before: deque[str] = deque(maxlen=num_context_lines)
+    ahead: deque[str] = deque(islice(paragraphs, num_context_lines + 1))
+    index = 0
+    while ahead:
+        line = ahead.popleft()
         clean_line = clean_text(line)
         if str_has_date(clean_line):
             if with_context:
-                before = clean_context(lines[max(0, i - num_context_lines):i]) # N-k lines
-                after = clean_context(lines[i + 1:min(len(lines), i + num_context_lines + 1)]) # N+k lines
-                yield DateContext.from_json(
-                    {
-                        "content": clean_line,
-                        "index": i,
-                        "before": before,
-                        "after": after,
-                        "window_size": window_size,
-                    }
+                # direct construction: from_json would re-unidecode strings
+                # that clean_text/clean_context already normalized
+                yield DateContext(
+                    content=clean_line,
+                    index=index,
+                    before=clean_context(list(before)), # N-k lines
+                    after=clean_context(list(ahead)), # N+k lines
+                    window_size=window_size,
                 )
             else:
-                yield clean_line
\ No newline at end of file
+                yield clean_line
+        before.append(line)
+        index += 1
+        if len(ahead) <= num_context_lines:
+            ahead.extend(islice(paragraphs, num_context_lines + 1 - len(ahead)))
\ No newline at end of file
@@ -1,11 +1,122 @@
 import logging
 import re
+import threading
+import time
 import requests
-from typing import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from requests.adapters import HTTPAdapter, Retry
+from typing import Callable, Iterable
 
-from openplace.tasks.scrape.patterns import LINK_REGEX, PAGE_STATE_REGEX
+from email.message import Message
+
+from openplace.tasks.scrape.patterns import LINK_RE, PAGE_STATE_RE_B
 logger = logging.getLogger(__name__)
 
+# shared host prefix and DCE endpoint template, formatted once per call
+# instead of re-parsing the same literal in every fetcher
+_BASE = 'https://www.marches-publics.gouv.fr'
+_URL_DCE_TMPL = _BASE + '/index.php?page=Entreprise.EntrepriseDemandeTelechargementDce&id={}&orgAcronyme={}'
+
+def _parse_filename(content_disposition: str) -> str | None:
+    """
+    Extract the filename from a Content-Disposition header (RFC 6266).
+    The PLACE endpoints return quoted, unquoted and trailing-semicolon
+    variants; the stdlib header parser covers them all in one place instead
+    of one regex per shape.
+    """
+    message = Message()
+    message['content-disposition'] = content_disposition
+    return message.get_filename()
+
+# split timeouts: a stuck endpoint should fail its worker fast instead of
+# pinning it for minutes, so connect is short and read covers slow transfers
+_CONNECT_TIMEOUT = 10
+_READ_TIMEOUT = 120
+TIMEOUT = (_CONNECT_TIMEOUT, _READ_TIMEOUT)
+
+# one pooled session for the whole scrape layer: keep-alive connections skip
+# the DNS + TCP + TLS handshake on every hit. 500 is deliberately absent from
+# the retry list because the search pagination uses it as its end marker.
+SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=3,
+        connect=3,
+        read=2,
+        backoff_factor=0.5,
+        status_forcelist=[502, 503, 504],
+        allowed_methods=frozenset(['GET', 'POST']),
+    ),
+)
+SESSION.mount('https://', _adapter)
+SESSION.mount('http://', _adapter)
+
+# shared pool for the per-posting file fetches: bounded globally so nested
+# callers (e.g. one worker per posting) cannot multiply the connection count
+_FILE_POOL = ThreadPoolExecutor(max_workers=8)
+
+# validated PRADO state per posting, kept briefly so a retried DCE download
+# skips the two setup round trips while the server session is still valid.
+# Guarded by a lock because fetches run on _FILE_POOL threads.
+_DCE_STATE_TTL = 300
+_DCE_STATE_MAX = 1024
+_DCE_STATE_CACHE: dict[tuple[str, str], tuple[float, str, str]] = {}
+_DCE_STATE_LOCK = threading.Lock()
+
+def _dce_state_get(key: tuple[str, str]) -> tuple[str, str] | None:
+    with _DCE_STATE_LOCK:
+        entry = _DCE_STATE_CACHE.get(key)
+        if entry is None:
+            return None
+        expires_at, cookie, page_state = entry
+        if time.monotonic() > expires_at:
+            del _DCE_STATE_CACHE[key]
+            return None
+        return cookie, page_state
+
+def _dce_state_put(key: tuple[str, str], cookie: str, page_state: str) -> None:
+    now = time.monotonic()
+    with _DCE_STATE_LOCK:
+        if len(_DCE_STATE_CACHE) >= _DCE_STATE_MAX:
+            expired = [k for k, (expires_at, _, _) in _DCE_STATE_CACHE.items() if now > expires_at]
+            for k in expired:
+                del _DCE_STATE_CACHE[k]
+            if len(_DCE_STATE_CACHE) >= _DCE_STATE_MAX:
+                _DCE_STATE_CACHE.pop(next(iter(_DCE_STATE_CACHE)))
+        _DCE_STATE_CACHE[key] = (now + _DCE_STATE_TTL, cookie, page_state)
+
+def _dce_state_drop(key: tuple[str, str]) -> None:
+    with _DCE_STATE_LOCK:
+        _DCE_STATE_CACHE.pop(key, None)
+
+def _scan_page_state(response: requests.Response, page_state_regex: re.Pattern[bytes] = PAGE_STATE_RE_B) -> str | None:
+    """
+    Incrementally scan a streamed response for the PRADO_PAGESTATE token.
+    PRADO puts the hidden input near the top of the page, so scanning chunk
+    by chunk and aborting the transfer on the first hit avoids downloading
+    and decoding the rest of the document.
+
+    Args:
+        response (requests.Response): A response opened with `stream=True`.
+        page_state_regex (re.Pattern[bytes]): Compiled bytes pattern for the token.
+
+    Returns:
+        str | None: The page state, or None if the token is not in the body.
+    """
+    buffer = bytearray()
+    try:
+        for chunk in response.iter_content(chunk_size=16384):
+            buffer += chunk
+            match = page_state_regex.search(buffer)
+            if match:
+                return match.group(1).decode('ascii')
+    finally:
+        response.close()
+    return None
+
 def fetch_posting_page(link_posting: str) -> tuple[str, str, requests.Response]:
     """
     Validate the link_posting using the provided regex, log the process, and fetch the page.
@@ -19,38 +130,141 @@ def fetch_posting_page(link_posting: str) -> tuple[str, str, requests.Response]:
     Raises:
         ValueError: If the link does not match the expected format or the page fetch fails.
     """
-    match = re.match(LINK_REGEX, link_posting)
+    # cheap prefix check first: bulk link lists can carry garbage URLs, and
+    # startswith rejects those without invoking the regex engine
+    match = LINK_RE.fullmatch(link_posting) if link_posting.startswith(_BASE) else None
     if not match:
-        logger.error(f"Link does not match expected format: {link_posting}")
+        logger.error("Link does not match expected format: %s", link_posting)
         raise ValueError(f"Link does not match expected format: {link_posting}")
     posting_id, org_acronym = match.groups()
-    logger.debug(f"Extracted posting_id={posting_id}, org_acronym={org_acronym} from link.")
+    logger.debug("Extracted posting_id=%s, org_acronym=%s from link.", posting_id, org_acronym)
 
     try:
-        response = requests.get(link_posting, allow_redirects=False, timeout=600)
+        response = SESSION.get(link_posting, allow_redirects=False, timeout=TIMEOUT)
     except Exception as exc:
-        logger.error(f"Exception occurred while fetching page: {link_posting} - {exc}")
+        logger.error("Exception occurred while fetching page: %s - %s", link_posting, exc)
         raise
 
     if response.status_code != 200:
-        logger.error(f"Failed to fetch page: {link_posting} (status {response.status_code})")
+        logger.error("Failed to fetch page: %s (status %s)", link_posting, response.status_code)
         raise ValueError(f"Failed to fetch page: {link_posting} (status {response.status_code})")
 
-    logger.debug(f"Successfully fetched page: {link_posting} (status {response.status_code})")
+    logger.debug("Successfully fetched page: %s (status %s)", link_posting, response.status_code)
     return posting_id, org_acronym, response
 
+# a few DCE have "Content-Type: application/octet-stream" even though they
+# are zip files, so both types are accepted
+_ZIP_CONTENT_TYPES = frozenset({'application/zip', 'application/octet-stream'})
+
 def is_zip_file(response: requests.Response) -> bool:
-    # a few DCE have "Content-Type: application/octet-stream" even though they are zip files
-    return (
-        response.headers['Content-Type'] == 'application/octet-stream' or
-        response.headers['Content-Type'] == 'application/zip'
-    )
+    # strip parameters so 'application/zip; charset=...' variants still match
+    content_type = response.headers.get('Content-Type', '')
+    return content_type.split(';', 1)[0].strip() in _ZIP_CONTENT_TYPES
+
+@dataclass
+class DceSession:
+    """
+    Stateful PRADO navigation for one DCE download.
+    Holds the cookie and page state shared by the three HTTP steps, so the
+    headers are built once and a failed step can be retried on its own
+    instead of replaying the whole chain.
+    """
+    posting_id: str
+    org_acronym: str
+    page_state_regex: re.Pattern[bytes] = PAGE_STATE_RE_B
+    cookie: str | None = None
+    page_state: str | None = None
+
+    @property
+    def url(self) -> str:
+        return _URL_DCE_TMPL.format(self.posting_id, self.org_acronym)
+
+    @property
+    def headers(self) -> dict[str, str]:
+        return {'Cookie': self.cookie} if self.cookie else {}
+
+    def init(self) -> None:
+        """
+        Step 1: initial GET to capture the page state and session cookie.
+        """
+        response = SESSION.get(self.url, allow_redirects=False, timeout=TIMEOUT, stream=True)
+        if response.status_code != 200:
+            raise ValueError(f"Initial DCE GET failed: {response.status_code}")
+        self.page_state = _scan_page_state(response, self.page_state_regex)
+        if self.page_state is None:
+            logger.error("Could not extract PRADO_PAGESTATE from initial DCE page.")
+            raise ValueError("Could not extract PRADO_PAGESTATE from initial DCE page.")
+        self.cookie = response.headers.get('Set-Cookie')
+        if not self.cookie:
+            logger.error("Set-Cookie header not found in initial DCE response.")
+            raise ValueError("Set-Cookie header not found in initial DCE response.")
+
+    def validate(self) -> None:
+        """
+        Step 2: POST to validateButton to advance the page state.
+        """
+        data_validate = {
+            'PRADO_PAGESTATE': self.page_state,
+            'PRADO_POSTBACK_TARGET': 'ctl0$CONTENU_PAGE$validateButton',
+            'ctl0$CONTENU_PAGE$EntrepriseFormulaireDemande$RadioGroup': 'ctl0$CONTENU_PAGE$EntrepriseFormulaireDemande$choixAnonyme',
+        }
+        response = SESSION.post(
+            self.url, headers=self.headers, data=data_validate, allow_redirects=False, timeout=TIMEOUT, stream=True
+        )
+        if response.status_code != 200:
+            raise ValueError(f"ValidateButton POST failed: {response.status_code}")
+        self.page_state = _scan_page_state(response, self.page_state_regex)
+        if self.page_state is None:
+            logger.error("Could not extract PRADO_PAGESTATE from validateButton POST response.")
+            raise ValueError("Could not extract PRADO_PAGESTATE from validateButton POST response.")
+
+    def download(self, file_writer: Callable[[str, str, str, requests.Response, bool], int]) -> tuple[str | None, int | None]:
+        """
+        Step 3: POST to completeDownload and stream the DCE file to the writer.
+        """
+        data_download = {
+            'PRADO_PAGESTATE': self.page_state,
+            'PRADO_POSTBACK_TARGET': 'ctl0$CONTENU_PAGE$EntrepriseDownloadDce$completeDownload',
+        }
+        # the payload is an already-compressed zip: asking for identity stops
+        # the server from pointlessly re-compressing it in transit
+        response = SESSION.post(
+            self.url,
+            headers={**self.headers, 'Accept-Encoding': 'identity'},
+            data=data_download,
+            stream=True,
+            timeout=TIMEOUT,
+        )
+        if response.status_code != 200:
+            raise ValueError(f"CompleteDownload POST failed: {response.status_code}")
+
+        if not is_zip_file(response):
+            logger.warning("Content-Type is unexpected: %s", response.headers['Content-Type'])
+
+        content_disposition = response.headers.get('Content-Disposition', None)
+        if not content_disposition:
+            logger.error("Content-Disposition header not found for posting_id=%s.", self.posting_id)
+            return None, None
+        filename_dce = _parse_filename(content_disposition)
+        if not filename_dce:
+            logger.error("Could not extract filename from Content-Disposition header: %s", content_disposition)
+            return None, None
+
+        file_size_dce = file_writer(
+            self.posting_id,
+            filename_dce,
+            'dce',
+            response,
+            True, # streaming
+        )
+
+        return filename_dce, file_size_dce
 
 def fetch_dce_file(
     posting_id: str,
     org_acronym: str,
     file_writer: Callable[[str, str, str, requests.Response, bool], int],
-    page_state_regex: str = PAGE_STATE_REGEX,
+    page_state_regex: re.Pattern[bytes] = PAGE_STATE_RE_B,
 ) -> tuple[str | None, int | None]:
     """
     Fetch the Dossier de Consultation aux Entreprises (DCE) file by navigating the required pages.
@@ -58,140 +272,120 @@ def fetch_dce_file(
     Args:
         posting_id (str): The ID of the announcement.
         org_acronym (str): The organization acronym.
-        link_dce (str): The DCE link fragment from the posting page.
-        write_response_to_file (callable): Function to write the response content to a file.
-        PAGE_STATE_REGEX (str): Regex pattern to extract PRADO_PAGESTATE.
+        file_writer (callable): Function to write the response content to a file.
+        page_state_regex (re.Pattern[bytes]): Compiled bytes pattern to extract PRADO_PAGESTATE
+        from the raw response body, skipping a full decode of the page.
 
     Returns:
         tuple[str | None, int | None]: The filename of the DCE and its file size, or (None, None) if not found.
 
     Raises:
-        AssertionError: If any of the HTTP requests fail.
-        ValueError: If required headers or page state cannot be extracted.
+        ValueError: If any HTTP request fails or required headers or page state cannot be extracted.
     """
-    url_dce = (
-        f'https://www.marches-publics.gouv.fr/index.php?page=Entreprise.EntrepriseDemandeTelechargementDce'
-        f'&id={posting_id}&orgAcronyme={org_acronym}'
-    )
-    # Step 1: Initial GET request to get page state and cookie
-    response_dce = requests.get(url_dce, allow_redirects=False, timeout=600)
-    assert response_dce.status_code == 200, f"Initial DCE GET failed: {response_dce.status_code}"
-    match_page_state = re.search(page_state_regex, response_dce.text)
-    if not match_page_state:
-        logger.error("Could not extract PRADO_PAGESTATE from initial DCE page.")
-        raise ValueError("Could not extract PRADO_PAGESTATE from initial DCE page.")
-    page_state = match_page_state.groups()[0]
-    cookie = response_dce.headers.get('Set-Cookie')
-    if not cookie:
-        logger.error("Set-Cookie header not found in initial DCE response.")
-        raise ValueError("Set-Cookie header not found in initial DCE response.")
-
-    # Step 2: POST to validateButton to get new page state
-    data_validate = {
-        'PRADO_PAGESTATE': page_state,
-        'PRADO_POSTBACK_TARGET': 'ctl0$CONTENU_PAGE$validateButton',
-        'ctl0$CONTENU_PAGE$EntrepriseFormulaireDemande$RadioGroup': 'ctl0$CONTENU_PAGE$EntrepriseFormulaireDemande$choixAnonyme',
-    }
-    response_after_validation = requests.post(
-        url_dce, headers={'Cookie': cookie}, data=data_validate, allow_redirects=False, timeout=600
-    )
-    assert response_after_validation.status_code == 200, f"ValidateButton POST failed: {response_after_validation.status_code}"
-    match_page_state_after_validation = re.search(page_state_regex, response_after_validation.text)
-    if not match_page_state_after_validation:
-        logger.error("Could not extract PRADO_PAGESTATE from validateButton POST response.")
-        raise ValueError("Could not extract PRADO_PAGESTATE from validateButton POST response.")
-    page_state = match_page_state_after_validation.groups()[0]
-
-    # Step 3: POST to completeDownload to get the DCE file
-    data_download = {
-        'PRADO_PAGESTATE': page_state,
-        'PRADO_POSTBACK_TARGET': 'ctl0$CONTENU_PAGE$EntrepriseDownloadDce$completeDownload',
-    }
-    response_download = requests.post(
-        url_dce, 
-        headers={
-            'Cookie': cookie,
-        }, 
-        data=data_download, 
-        stream=True, 
-        timeout=600
-    )
-    assert response_download.status_code == 200, f"CompleteDownload POST failed: {response_download.status_code}"
-
-    if not is_zip_file(response_download):
-        logger.warning(f"Content-Type is unexpected: {response_download.headers['Content-Type']}")
-
-    regex_attachment = r'^attachment; filename="([^"]+)";$'
-    content_disposition = response_download.headers.get('Content-Disposition', None)
-    if not content_disposition:
-        logger.error("Content-Disposition header not found for posting_id=%s.", posting_id)
-        return None, None
-    match_filename = re.match(regex_attachment, content_disposition)
-    if not match_filename:
-        logger.error("Could not extract filename from Content-Disposition header: %s", content_disposition)
-        return None, None
-    filename_dce = match_filename.groups()[0]
-
-    file_size_dce = file_writer(
-        posting_id,
-        filename_dce,
-        'dce',
-        response_download,
-        True, # streaming
-    )
-
-    return filename_dce, file_size_dce
-
-def fetch_reglement_file(
+    key = (posting_id, org_acronym)
+    dce_session = DceSession(posting_id, org_acronym, page_state_regex)
+    cached = _dce_state_get(key)
+    if cached is not None:
+        # a previous attempt already walked steps 1 and 2: go straight to
+        # the download while the server session is still alive
+        logger.debug("Reusing validated DCE state for posting_id=%s.", posting_id)
+        dce_session.cookie, dce_session.page_state = cached
+    else:
+        dce_session.init()
+        dce_session.validate()
+        _dce_state_put(key, dce_session.cookie, dce_session.page_state)
+    try:
+        result = dce_session.download(file_writer)
+    except Exception:
+        if cached is None:
+            # the failed POST did not hand out the file, so the freshly
+            # validated state stays cached for a caller-level retry to reuse
+            raise
+        # the cached server session may have expired: redo the full chain
+        # once, caching the new state in case this download fails too
+        _dce_state_drop(key)
+        dce_session = DceSession(posting_id, org_acronym, page_state_regex)
+        dce_session.init()
+        dce_session.validate()
+        _dce_state_put(key, dce_session.cookie, dce_session.page_state)
+        result = dce_session.download(file_writer)
+    # a successful completeDownload consumed the page state, so it must
+    # not be reused
+    _dce_state_drop(key)
+    return result
+
+# kind -> whether the fetcher raises on a missing filename. The reglement
+# endpoint is flaky about Content-Disposition, so the fetcher does not raise
+# itself and the writer is still called; it rejects the empty filename with
+# its own ValueError. complement and avis should always carry one, so those
+# fail here with the more specific Content-Disposition error.
+_RAISE_ON_MISSING_FILENAME = {'reglement': False, 'complement': True, 'avis': True}
+
+def _fetch_link_file(
     posting_id: str,
-    link_reglement: str,
+    link: str,
+    kind: str,
     file_writer: Callable[[str, str, str, requests.Response, bool], int],
 ) -> tuple[str | None, int | None]:
     """
-    Fetch the reglement file from the given link, save it, and return its filename and size.
+    Fetch one link-based file (reglement, complement or avis), save it, and
+    return its filename and size. The three kinds share the same GET +
+    Content-Disposition + writer flow and differ only in how a missing
+    filename is handled, per `_RAISE_ON_MISSING_FILENAME`.
 
     Args:
         posting_id (str): The ID of the announcement.
-        link_reglement (str): The relative URL to the reglement file.
-        write_response_to_file (Callable): Function to write the response content to a file.
+        link (str): The relative URL to the file.
+        kind (str): The file kind, one of 'reglement', 'complement', 'avis'.
+        file_writer (Callable): Function to write the response content to a file.
 
     Returns:
-        Tuple[str | None, int | None]: The filename and file size of the reglement, or (None, None) if not found.
+        Tuple[str | None, int | None]: The filename and file size, or (None, None) if not found.
+
+    Raises:
+        ValueError: If the GET fails, or the filename is missing for a kind that requires it.
     """
-    if not link_reglement:
-        logger.info("No reglement link provided for posting_id=%s.", posting_id)
+    if not link:
+        logger.info("No %s link provided for posting_id=%s.", kind, posting_id)
         return None, None
 
-    url = f'https://www.marches-publics.gouv.fr{link_reglement}'
-    logger.info("Fetching reglement file for posting_id=%s from URL: %s", posting_id, url)
-    response_reglement = requests.get(url, stream=True, timeout=600)
-    if response_reglement.status_code != 200:
-        logger.error("Failed to fetch reglement file for posting_id=%s, status_code=%d", posting_id, response_reglement.status_code)
+    url = _BASE + link
+    logger.info("Fetching %s file for posting_id=%s from URL: %s", kind, posting_id, url)
+    response = SESSION.get(url, stream=True, timeout=TIMEOUT)
+    if response.status_code != 200:
+        logger.error("Failed to fetch %s file for posting_id=%s, status_code=%d", kind, posting_id, response.status_code)
+        raise ValueError(f"Failed to fetch {kind} file: {response.status_code}")
 
-    regex_attachment = r'^attachment; filename="([^"]+)";$'
-    content_disposition = response_reglement.headers.get('Content-Disposition', None)
+    content_disposition = response.headers.get('Content-Disposition', None)
     if not content_disposition:
         logger.error("Content-Disposition header not found for posting_id=%s.", posting_id)
         return None, None
 
-    match_filename = re.match(regex_attachment, content_disposition)
-    if not match_filename:
+    filename = _parse_filename(content_disposition)
+    if not filename:
         logger.error("Could not extract filename from Content-Disposition header for posting_id=%s.", posting_id)
-
-    filename_reglement = match_filename.groups()[0] if match_filename else None
-
-    if not filename_reglement:
-        logger.warning("Could not extract filename from Content-Disposition header for posting_id=%s.", posting_id)
-    logger.info("Saving reglement file '%s' for posting_id=%s.", filename_reglement, posting_id)
-    file_size_reglement = file_writer(
+        if _RAISE_ON_MISSING_FILENAME[kind]:
+            raise ValueError("Could not extract filename from Content-Disposition header.")
+    logger.info("Saving %s file '%s' for posting_id=%s.", kind, filename, posting_id)
+    file_size = file_writer(
         posting_id,
-        filename_reglement,
-        'reglement',
-        response_reglement,
+        filename,
+        kind,
+        response,
         True, # streaming
     )
-    logger.info("Reglement file saved: %s (%d bytes) for posting_id=%s.", filename_reglement, file_size_reglement, posting_id)
-    return filename_reglement, file_size_reglement
+    logger.info("%s file saved: %s (%d bytes) for posting_id=%s.", kind, filename, file_size, posting_id)
+    return filename, file_size
+
+def fetch_reglement_file(
+    posting_id: str,
+    link_reglement: str,
+    file_writer: Callable[[str, str, str, requests.Response, bool], int],
+) -> tuple[str | None, int | None]:
+    """
+    Fetch the reglement file from the given link, save it, and return its filename and size.
+    """
+    return _fetch_link_file(posting_id, link_reglement, 'reglement', file_writer)
 
 def fetch_complement_file(
     posting_id: str,
@@ -200,44 +394,8 @@ def fetch_complement_file(
 ) -> tuple[str | None, int | None]:
     """
     Fetch the complement file from the given link, save it, and return its filename and size.
-
-    Args:
-        posting_id (str): The ID of the announcement.
-        link_complement (str): The relative URL to the complement file. 
-        write_response_to_file (Callable): Function to write the response content to a file.
-
-    Returns:
-        Tuple[str | None, int | None]: The filename and file size of the complement, or (None, None) if not found.
     """
-    if not link_complement:
-        logger.info("No complement link provided for posting_id=%s.", posting_id)
-        return None, None
-
-    url = f'https://www.marches-publics.gouv.fr{link_complement}'
-    logger.info("Fetching complement file for posting_id=%s from URL: %s", posting_id, url)
-    response_complement = requests.get(url, stream=True, timeout=600)
-    if response_complement.status_code != 200:
-        logger.error("Failed to fetch complement file for posting_id=%s, status_code=%d", posting_id, response_complement.status_code)
-        raise ValueError(f"Failed to fetch complement file: {response_complement.status_code}")
-
-    regex_attachment = r'^attachment; filename="([^"]+)"'
-    content_disp = response_complement.headers.get('Content-Disposition', '')
-    match_filename = re.match(regex_attachment, content_disp)
-    if not match_filename:
-        logger.error("Could not extract filename from Content-Disposition header for posting_id=%s.", posting_id)
-        raise ValueError("Could not extract filename from Content-Disposition header.")
-
-    filename_complement = match_filename.groups()[0]
-    logger.info("Saving complement file '%s' for posting_id=%s.", filename_complement, posting_id)
-    file_size_complement = file_writer(
-        posting_id,
-        filename_complement,
-        'complement',
-        response_complement,
-        True, # streaming
-    )
-    logger.info("Complement file saved: %s (%d bytes) for posting_id=%s.", filename_complement, file_size_complement, posting_id)
-    return filename_complement, file_size_complement
+    return _fetch_link_file(posting_id, link_complement, 'complement', file_writer)
 
 def fetch_avis_file(
     posting_id: str,
@@ -246,62 +404,31 @@ def fetch_avis_file(
 ) -> tuple[str | None, int | None]:
     """
     Fetch the avis file from the given link, save it, and return its filename and size.
-
-    Args:
-        posting_id (str): The ID of the announcement.
-        link_avis (str): The relative URL to the avis file.
-        write_response_to_file (Callable): Function to write the response content to a file.
-
-    Returns:
-        Tuple[str | None, int | None]: The filename and file size of the avis, or (None, None) if not found.
     """
-    if not link_avis:
-        logger.info("No avis link provided for posting_id=%s.", posting_id)
-        return None, None
-
-    url = f'https://www.marches-publics.gouv.fr{link_avis}'
-    logger.info("Fetching avis file for posting_id=%s from URL: %s", posting_id, url)
-    response_avis = requests.get(url, stream=True, timeout=600)
-    if response_avis.status_code != 200:
-        logger.error("Failed to fetch avis file for posting_id=%s, status_code=%d", posting_id, response_avis.status_code)
-        raise ValueError(f"Failed to fetch avis file: {response_avis.status_code}")
-
-    regex_attachment = r'^attachment; filename=([^;]+);'
-    content_disposition = response_avis.headers.get('Content-Disposition', None)
-    if not content_disposition:
-        logger.error("Content-Disposition header not found for posting_id=%s.", posting_id)
-        return None, None
-    match_filename = re.match(regex_attachment, content_disposition)
-    if not match_filename:
-        logger.error("Could not extract filename from Content-Disposition header for posting_id=%s.", posting_id)
-        raise ValueError("Could not extract filename from Content-Disposition header.")
-
-    filename_avis = match_filename.groups()[0]
-    logger.info("Saving avis file '%s' for posting_id=%s.", filename_avis, posting_id)
-    file_size_avis = file_writer(
-        posting_id,
-        filename_avis,
-        'avis',
-        response_avis,
-        True, # streaming
-    )
-    logger.info("Avis file saved: %s (%d bytes) for posting_id=%s.", filename_avis, file_size_avis, posting_id)
-    return filename_avis, file_size_avis
+    return _fetch_link_file(posting_id, link_avis, 'avis', file_writer)
 
 
 class PostingFileFetcher:  
-    def __init__(self, posting_id: str, org_acronym: str, file_writer: Callable[[str, str, str, requests.Response, bool], int], page_state_regex: str = PAGE_STATE_REGEX):
+    def __init__(self, posting_id: str, org_acronym: str, file_writer: Callable[[str, str, str, requests.Response, bool], int], page_state_regex: re.Pattern[bytes] = PAGE_STATE_RE_B):
         self.posting_id = posting_id
         self.org_acronym = org_acronym
         self.file_writer = file_writer
         self.page_state_regex = page_state_regex
-        
+        # kind -> fetcher table: one dict lookup per dispatch instead of a
+        # membership scan plus an if/elif cascade over the same string
+        self._dispatch: dict[str, Callable[[str], tuple[str | None, int | None]]] = {
+            'dce': lambda link: self.dce(self.posting_id, self.org_acronym, self.file_writer, self.page_state_regex),
+            'reglement': lambda link: self.reglement(self.posting_id, link, self.file_writer),
+            'complement': lambda link: self.complement(self.posting_id, link, self.file_writer),
+            'avis': lambda link: self.avis(self.posting_id, link, self.file_writer),
+        }
+
     @staticmethod
     def dce(
         posting_id: str,
         org_acronym: str,
         file_writer: Callable[[str, str, str, requests.Response, bool], int],
-        page_state_regex: str = PAGE_STATE_REGEX,
+        page_state_regex: re.Pattern[bytes] = PAGE_STATE_RE_B,
     ) -> tuple[str | None, int | None]:
         return fetch_dce_file(posting_id, org_acronym, file_writer, page_state_regex)
     
@@ -340,16 +467,28 @@ class PostingFileFetcher:
         Returns:
             tuple[str | None, int | None]: The filename and file size of the file, or (None, None) if not found.
         """
-        if kind not in ['dce', 'reglement', 'complement', 'avis']:
+        fetcher = self._dispatch.get(kind)
+        if fetcher is None:
             raise ValueError(f"Unknown file kind: {kind}")
-        
-        if kind == 'dce':
-            return self.dce(self.posting_id, self.org_acronym, self.file_writer, self.page_state_regex)
-        elif kind == 'reglement':
-            return self.reglement(self.posting_id, link, self.file_writer)
-        elif kind == 'complement':
-            return self.complement(self.posting_id, link, self.file_writer)
-        elif kind == 'avis':
-            return self.avis(self.posting_id, link, self.file_writer)
-        else:
-            raise ValueError(f"Unknown file kind: {kind}")
\ No newline at end of file
+        return fetcher(link)
+
+    def fetch_all(self, links: Iterable[tuple[str, str]]) -> list[tuple[str, str | None, int | None]]:
+        """
+        Fetch several files of the posting concurrently.
+        The ancillary GETs are independent of each other and of the DCE
+        chain (each DCE fetch carries its own DceSession), so they run on a
+        shared thread pool and only block on the slowest transfer.
+
+        Args:
+            links (Iterable[tuple[str, str]]): (kind, link) pairs to fetch.
+
+        Returns:
+            list[tuple[str, str | None, int | None]]: (kind, filename, file_size)
+            per input link, in input order.
+        """
+        futures = [(kind, _FILE_POOL.submit(self, kind, link)) for kind, link in links]
+        results: list[tuple[str, str | None, int | None]] = []
+        for kind, future in futures:
+            filename, file_size = future.result()
+            results.append((kind, filename, file_size))
+        return results
\ No newline at end of file
@@ -1,14 +1,53 @@
+import json
 import logging
+import queue
+import threading
+import time
+from pathlib import Path
 from typing import Iterator
 import requests
-import re
+from openplace.tasks.scrape.fetch import SESSION, TIMEOUT
 from openplace.tasks.scrape.parse import extract_links_from_anchor_tags
-from openplace.tasks.scrape.patterns import URL_SEARCH, PAGE_STATE_REGEX, LINK_REGEX
+from openplace.tasks.scrape.patterns import URL_SEARCH, PAGE_STATE_RE_B, LINK_RE
 from openplace.tasks.store.types import StorageType
 from openplace.storage.local.queries import list_postings
 
 logger = logging.getLogger(__name__)
 
+# cold-start cache for the search session: short scraper invocations (e.g.
+# cron jobs) skip the initial handshake round trip while the server-side
+# session is still alive
+_STATE_CACHE_PATH = Path("~/.cache/openplace/session.json").expanduser()
+_STATE_CACHE_TTL = 300
+
+def _load_cached_state() -> tuple[str, str] | None:
+    """
+    Load a recent (page_state, cookie) pair from the on-disk cache, or None
+    if the cache is missing, unreadable or older than `_STATE_CACHE_TTL`.
+    """
+    try:
+        state = json.loads(_STATE_CACHE_PATH.read_text())
+        if time.time() - state['timestamp'] > _STATE_CACHE_TTL:
+            return None
+        return state['page_state'], state['cookie']
+    except (OSError, ValueError, KeyError):
+        return None
+
+def _save_cached_state(page_state: str, cookie: str) -> None:
+    """
+    Persist the (page_state, cookie) pair for the next process; best-effort,
+    a read-only cache directory must not fail the crawl.
+    """
+    try:
+        _STATE_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _STATE_CACHE_PATH.write_text(json.dumps({
+            'page_state': page_state,
+            'cookie': cookie,
+            'timestamp': time.time(),
+        }))
+    except OSError:
+        logger.warning("Could not persist session state to %s", _STATE_CACHE_PATH)
+
 class PlacePostingIterator:
     """
     Generator object that lazily fetches batches of deduplicated links from paginated search results.
@@ -18,6 +57,14 @@ class PlacePostingIterator:
     Provides a method to iterate a fixed number of times.
     """
 
+    # __next__ touches most of these on every page; slots keep the accesses
+    # off the per-instance dict
+    __slots__ = (
+        'links', 'page_state', 'cookie', 'previous_links', '_exhausted',
+        '_seen_links', '_batch_index', '_num_new_links', '_num_iterations',
+        '_state_from_cache',
+    )
+
     @classmethod
     def from_storage(cls, storage: StorageType) -> 'PlacePostingIterator':
         """
@@ -33,21 +80,37 @@ class PlacePostingIterator:
         stored_links = list_postings(storage=storage)
         return cls(links=[link.url for link in stored_links])
 
-    def _initialize_state(self) -> tuple[requests.Response, str, str]:
+    def _initialize_state(self, use_cache: bool = True) -> tuple[requests.Response | None, str, str]:
         """
-        Query the state of the search page.
+        Query the state of the search page, reusing a recent cached session
+        when available to skip the cold-start round trip.
+
+        Args:
+            use_cache (bool): Whether to try the on-disk state cache first.
 
         Returns:
-            tuple[requests.Response, str, str]: The response, page state and cookie.
+            tuple[requests.Response | None, str, str]: The response (None when
+            the cached state was reused), page state and cookie.
         """
-        response = requests.get(URL_SEARCH, allow_redirects=False, timeout=600)
-        assert response.status_code == 200, response.status_code
-        match_page_state = re.search(PAGE_STATE_REGEX, response.text)
+        if use_cache:
+            cached = _load_cached_state()
+            if cached is not None:
+                logger.info("Reusing cached search session state.")
+                self._state_from_cache = True
+                return None, *cached
+        self._state_from_cache = False
+        response = SESSION.get(URL_SEARCH, allow_redirects=False, timeout=TIMEOUT)
+        if response.status_code != 200:
+            raise RuntimeError(f"Initial search GET failed: {response.status_code}")
+        # search the raw bytes: decoding multi-MB result pages just to find an
+        # ASCII token is the dominant cost of a pagination step
+        match_page_state = PAGE_STATE_RE_B.search(response.content)
         if not match_page_state:
             logger.error("Could not extract PRADO_PAGESTATE from initial page.", response.text)
             raise RuntimeError("Could not extract PRADO_PAGESTATE from initial page.")
-        page_state = match_page_state.groups()[0]
+        page_state = match_page_state.group(1).decode('ascii')
         cookie = response.headers['Set-Cookie']
+        _save_cached_state(page_state, cookie)
         return response, page_state, cookie
 
     def _increment_state(self, page_state: str, cookie: str, num_results: int = 20) -> tuple[requests.Response, str, str]:
@@ -68,46 +131,56 @@ class PlacePostingIterator:
             'PRADO_POSTBACK_TARGET': 'ctl0$CONTENU_PAGE$resultSearch$PagerTop$ctl2',
             'ctl0$CONTENU_PAGE$resultSearch$listePageSizeTop': num_results,
         }
-        response = requests.post(
+        response = SESSION.post(
             URL_SEARCH,
             headers={'Cookie': cookie},
             data=data,
             allow_redirects=False,
-            timeout=600,
+            timeout=TIMEOUT,
         )
-        assert response.status_code == 200, response.status_code
-        match_page_state = re.search(PAGE_STATE_REGEX, response.text)
+        if response.status_code != 200:
+            raise RuntimeError(f"Page-size POST failed: {response.status_code}")
+        match_page_state = PAGE_STATE_RE_B.search(response.content)
         if not match_page_state:
             logger.error("Could not extract PRADO_PAGESTATE from page after setting page size.", response.text)
             raise RuntimeError("Could not extract PRADO_PAGESTATE from page after setting page size.")
-        new_page_state = match_page_state.groups()[0]
+        new_page_state = match_page_state.group(1).decode('ascii')
         return response, new_page_state, cookie
 
     def __init__(self, links: list[str] | None = None) -> None:
         """
         Initialize the generator by fetching the first page and setting initial state.
         """
+        # seeded before any fetch so _deduplicate_links can rely on it
+        self._seen_links: set[str] = set(links) if links is not None else set()
         if links is not None:
             self.links = links
             self.page_state = None
             self.cookie = None
             self.previous_links = None
             self._exhausted = False
-            self._seen_links: set[str] = set(self.links)
         # get page state and attempt to fetch another batch of links
 
         response, page_state, cookie = self._initialize_state()
 
         # use page with 20 results
-        response, page_state, cookie = self._increment_state(page_state, cookie, num_results=20)
-        links = extract_links_from_anchor_tags(response, LINK_REGEX)
+        try:
+            response, page_state, cookie = self._increment_state(page_state, cookie, num_results=20)
+        except RuntimeError:
+            if not self._state_from_cache:
+                raise
+            # the cached session expired server-side: redo the handshake once
+            logger.info("Cached search session state is stale, re-initializing.")
+            response, page_state, cookie = self._initialize_state(use_cache=False)
+            response, page_state, cookie = self._increment_state(page_state, cookie, num_results=20)
+        links = extract_links_from_anchor_tags(response, LINK_RE)
 
         self.links: list[str] = self._deduplicate_links(links)
         self.page_state = page_state
         self.cookie = cookie
         self.previous_links: list[str] | None = None
         self._exhausted = False
-        self._seen_links: set[str] = set(self.links)
+        self._seen_links.update(self.links)
         self._batch_index = 0
         self._num_new_links = 0
         self._num_iterations = 0
@@ -144,30 +217,30 @@ class PlacePostingIterator:
             'PRADO_PAGESTATE': self.page_state,
             'PRADO_POSTBACK_TARGET': 'ctl0$CONTENU_PAGE$resultSearch$PagerTop$ctl2',
         }
-        response = requests.post(
+        response = SESSION.post(
             URL_SEARCH,
             headers={'Cookie': self.cookie},
             data=data,
             allow_redirects=False,
-            timeout=600,
+            timeout=TIMEOUT,
         )
         if response.status_code == 500:
             self._exhausted = True
             raise StopIteration
-        assert response.status_code == 200, response.status_code
-        links = extract_links_from_anchor_tags(response, LINK_REGEX)
-        match_page_state = re.search(PAGE_STATE_REGEX, response.text)
+        if response.status_code != 200:
+            raise RuntimeError(f"Pagination POST failed: {response.status_code}")
+        links = extract_links_from_anchor_tags(response, LINK_RE)
+        match_page_state = PAGE_STATE_RE_B.search(response.content)
         if not match_page_state:
             self._exhausted = True
             raise StopIteration
-        page_state = match_page_state.groups()[0]
+        page_state = match_page_state.group(1).decode('ascii')
         if self.page_state == page_state:
             self._exhausted = True
             raise StopIteration
-        if self.previous_links == links:
-            self._exhausted = True
-            raise StopIteration
 
+        # a page identical to the previous one dedups to nothing against the
+        # seen-set, so no separate previous_links list comparison is needed
         deduped_links = self._deduplicate_links(links)
         if not deduped_links:
             self._exhausted = True
@@ -175,7 +248,6 @@ class PlacePostingIterator:
 
         self.links = deduped_links
         self.page_state = page_state
-        self.cookie = self.cookie  # cookie may not change
         self.previous_links = links
         self._seen_links.update(deduped_links)
         self._batch_index += 1
@@ -193,8 +265,10 @@ class PlacePostingIterator:
         Returns:
             list[str]: Deduplicated list of links.
         """
-        deduped = [link for link in links if link not in getattr(self, '_seen_links', set())]
-        return deduped
+        seen = self._seen_links
+        # dict.fromkeys keeps page order while also dropping duplicates
+        # that appear twice within the same batch
+        return list(dict.fromkeys(link for link in links if link not in seen))
 
     def iter_n_batches(self, n: int, ensure_n_new_links: int | None = None) -> Iterator[list[str]]:
         """
@@ -219,4 +293,43 @@ class PlacePostingIterator:
             for batch in self:
                 yield batch
                 if self._batch_index+1 >= n:
-                    break
\ No newline at end of file
+                    break
+
+    def iter_n_batches_prefetch(self, n: int, ensure_n_new_links: int | None = None, prefetch: int = 2) -> Iterator[list[str]]:
+        """
+        Iterate like `iter_n_batches`, but fetch ahead in a background thread.
+        The next page's POST runs while the caller is still processing the
+        current batch, overlapping the pagination round trip with downstream
+        work. Safe because only the producer thread mutates iterator state.
+
+        Args:
+            n (int): The maximum number of batches to yield.
+            ensure_n_new_links (int | None): The number of new links to ensure, as in `iter_n_batches`.
+            prefetch (int): How many batches may be buffered ahead of the consumer.
+
+        Yields:
+            Iterator[list[str]]: Up to n batches of deduplicated links.
+        """
+        batches: queue.Queue = queue.Queue(maxsize=prefetch)
+        sentinel = object()
+
+        def produce() -> None:
+            try:
+                for batch in self.iter_n_batches(n, ensure_n_new_links):
+                    batches.put(batch)
+            except BaseException as exc:  # re-raised on the consumer side
+                batches.put(exc)
+                return
+            batches.put(sentinel)
+
+        # daemon so an abandoned consumer does not keep the process alive
+        producer = threading.Thread(target=produce, daemon=True)
+        producer.start()
+        while True:
+            item = batches.get()
+            if item is sentinel:
+                break
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+        producer.join()
\ No newline at end of file
@@ -1,70 +1,98 @@
 import logging
 from typing import Any, Dict
-from bs4 import BeautifulSoup
-from bs4.element import Tag
+from lxml import etree
+from lxml import html as lxml_html
+from lxml.html import HtmlElement
 import re
 import requests
 
-from openplace.tasks.scrape.patterns import BOAMP_REGEX
+from openplace.tasks.scrape.patterns import BOAMP_RE
 
 logger = logging.getLogger(__name__)
 
-def extract_field(info_sections: list[Tag], idx: int, label: str) -> str:
+# compiled once: evaluated on every paginated result page
+_HREF_XPATH = etree.XPath('//a/@href')
+
+def to_tree(content: HtmlElement | requests.Response) -> HtmlElement:
+    """
+    Return an lxml tree for the given content, parsing it if it is a raw
+    response. Callers that feed the same page to several parse functions
+    should call this once and pass the tree around instead of re-parsing.
+    """
+    if isinstance(content, requests.Response):
+        # pass raw bytes so lxml handles encoding detection in C
+        return lxml_html.fromstring(content.content)
+    return content
+
+def extract_recap_fields(tree: HtmlElement) -> Dict[str, str]:
+    """
+    Extract the label/value pairs of the posting recap sections in one pass.
+
+    Args:
+        tree (HtmlElement): The parsed posting page.
+
+    Returns:
+        Dict[str, str]: Mapping from stripped label text to stripped value text.
     """
-    Extract a field from the recap_data list.
+    recap: Dict[str, str] = {}
+    sections = tree.xpath('//div[contains(@class, "col-md-10") and contains(@class, "text-justify")]')
+    logger.debug("Found %d info_sections elements.", len(sections))
+    for section in sections:
+        labels = section.xpath('.//label/text()')
+        values = section.xpath('.//div/span/text()')
+        if labels and values:
+            recap[labels[0].strip()] = values[0].strip()
+    return recap
+
+def recap_field(recap: Dict[str, str], label: str) -> str:
+    """
+    Extract a field from the recap mapping.
 
     Args:
-        info_sections (list[Tag]): The list of BeautifulSoup elements containing the recap data.
-        idx (int): The index of the field to extract.
+        recap (Dict[str, str]): The label/value mapping from `extract_recap_fields`.
         label (str): The label of the field to extract.
 
     Returns:
         str: The extracted field value.
 
     Raises:
-        ValueError: If the expected label is not found or the value is not found.
+        ValueError: If the expected label is not found.
     """
-    section = info_sections[idx]
-    found_label = section.find('label')
-    if not found_label or found_label.text.strip() != label:
-        logger.error(f"Expected label '{label}' at index {idx}, found '{found_label.text.strip() if found_label else None}'")
-        raise ValueError(f"Expected label '{label}' at index {idx}, found '{found_label.text.strip() if found_label else None}'")
-    value = section.find('div').find('span')
-    if not value:
-        logger.error(f"Value for label '{label}' not found.")
-        raise ValueError(f"Value for label '{label}' not found.")
-    return value.text.strip()
+    value = recap.get(label)
+    if value is None:
+        logger.error("Expected label '%s' not found in recap sections: %s", label, sorted(recap))
+        raise ValueError(f"Expected label '{label}' not found in recap sections: {sorted(recap)}")
+    return value
 
-def parse_posting_info(content: BeautifulSoup | requests.Response) -> Dict[str, Any]:
+def parse_posting_info(content: HtmlElement | requests.Response) -> Dict[str, Any]:
     """
-    Parse the posting information from the given BeautifulSoup object or requests.Response.
+    Parse the posting information from the given lxml tree or requests.Response.
 
     Args:
-        content (BeautifulSoup | requests.Response): The BeautifulSoup object or requests.Response containing the HTML page.
+        content (HtmlElement | requests.Response): The lxml tree or requests.Response containing the HTML page.
 
     Returns:
         Dict[str, Any]: A dictionary with keys 'reference', 'title', 'description', and 'organization'.
 
     Raises:
-        AssertionError: If the expected labels are not found in the HTML.
+        ValueError: If the expected labels are not found in the HTML.
     """
-    if isinstance(content, requests.Response):
-        content = BeautifulSoup(content.text, 'html.parser')
+    tree = to_tree(content)
 
-    info_sections = content.find_all(class_="col-md-10 text-justify")
+    # a single xpath pass gathers every label/value pair; the per-field
+    # lookups below are then plain dict accesses instead of tree walks
+    recap = extract_recap_fields(tree)
 
-    logger.debug("Found %d info_sections elements.", len(info_sections))
-
-    reference = extract_field(info_sections, 0, "Référence :")
+    reference = recap_field(recap, "Référence :")
     logger.debug("Extracted reference: %s", reference)
 
-    title = extract_field(info_sections, 1, "Intitulé :")
+    title = recap_field(recap, "Intitulé :")
     logger.debug("Extracted title: %s", title)
 
-    description = extract_field(info_sections, 2, "Objet :")
+    description = recap_field(recap, "Objet :")
     logger.debug("Extracted description: %s", description)
 
-    organization = extract_field(info_sections, 3, "Organisme :")
+    organization = recap_field(recap, "Organisme :")
     logger.debug("Extracted organization: %s", organization)
 
     posting_info: Dict[str, Any] = {
@@ -76,6 +104,16 @@ def parse_posting_info(content: BeautifulSoup | requests.Response) -> Dict[str,
     logger.debug("Parsed posting info: %s", posting_info)
     return posting_info
 
+# anchor id -> file kind: a single hash lookup per anchor instead of a
+# literal-by-literal comparison chain
+_LINK_TYPE_MAP = {
+    'linkDownloadReglement': 'reglement',
+    'linkDownloadDce': 'dce',
+    'linkDownloadAvis': 'avis',
+    'linkDownloadComplement': 'complement',
+    'linkDownloadDume': 'dume',
+}
+
 def infer_link_type(link_id: str) -> str | None:
     """
     Determine the type of link based on the link_id.
@@ -89,47 +127,42 @@ def infer_link_type(link_id: str) -> str | None:
     if link_id is None:
         return None
 
-    match link_id:
-        case 'linkDownloadReglement':
-            return 'reglement'
-        case 'linkDownloadDce':
-            return 'dce'
-        case 'linkDownloadAvis':
-            return 'avis'
-        case 'linkDownloadComplement':
-            return 'complement'
-        case 'linkDownloadDume':
-            return 'dume'
-        case _:
-            if not is_boamp_link(link_id):
-                logger.warning(f"Unknown link type: {link_id}")
-            return None
+    link_type = _LINK_TYPE_MAP.get(link_id)
+    if link_type is None and not is_boamp_link(link_id):
+        logger.warning("Unknown link type: %s", link_id)
+    return link_type
 
 def is_boamp_link(link_href: str) -> bool:
     """
     Check if the link is a BOAMP link.
     """
-    return re.match(BOAMP_REGEX, link_href) is not None
-
-def parse_posting_links(content: BeautifulSoup | requests.Response) -> dict[str, list[str]]:
+    # almost every href is not a BOAMP URL: the tuple startswith rejects
+    # those with a memcmp before the regex engine is engaged
+    return (
+        link_href.startswith(('http://www.boamp.fr/', 'https://www.boamp.fr/'))
+        and BOAMP_RE.match(link_href) is not None
+    )
+
+def parse_posting_links(content: HtmlElement | requests.Response) -> dict[str, list[str]]:
     """
-    Parse the posting links from the given BeautifulSoup object or requests.Response.
+    Parse the posting links from the given lxml tree or requests.Response.
 
     Args:
-        content (BeautifulSoup | requests.Response): The BeautifulSoup object or requests.Response containing the HTML page.
+        content (HtmlElement | requests.Response): The lxml tree or requests.Response containing the HTML page.
 
     Returns:
-        tuple[list[str], list[str], list[str], list[str]]: A tuple containing the links to the reglement, dce, avis, and complement files.
+        dict[str, list[str]]: The links to the reglement, dce, avis, and complement files, by kind.
     """
-    if isinstance(content, requests.Response):
-        content = BeautifulSoup(content.text, 'html.parser')
+    tree = to_tree(content)
 
-    publicite_tab = content.find(id='pub')
-    if publicite_tab is None:
+    publicite_tab = tree.xpath('//*[@id="pub"]')
+    if not publicite_tab:
         logger.error("No publicite_tab found.")
         raise ValueError("No publicite_tab found.")
 
-    file_links = publicite_tab.find_all('a')
+    # the [@href] predicate filters inside libxml2, so anchors without a
+    # target never surface as Python elements
+    file_links = publicite_tab[0].xpath('.//a[@href]')
 
     links: dict[str, list[str]] = {
         'reglement': [],
@@ -140,18 +173,18 @@ def parse_posting_links(content: BeautifulSoup | requests.Response) -> dict[str,
     }
 
     for link in file_links:
-        link_href = link.attrs['href']
+        link_href = link.get('href')
 
         if not link_href:
             continue
 
-        link_id = link.attrs['id'] if 'id' in link.attrs else None
+        link_id = link.get('id')
 
         inferred_link_type = infer_link_type(link_id)
 
         if inferred_link_type is None:
             if not is_boamp_link(link_href):
-                logger.warning(f"No link type found for link: {link_id} : {link_href}")
+                logger.warning("No link type found for link: %s : %s", link_id, link_href)
             continue
         elif inferred_link_type == 'dume':
             continue
@@ -161,26 +194,22 @@ def parse_posting_links(content: BeautifulSoup | requests.Response) -> dict[str,
     return links
 
 
-def extract_links_from_anchor_tags(request_result: requests.Response, regex: str) -> list[str]:
+def extract_links_from_anchor_tags(request_result: requests.Response, regex: str | re.Pattern[str]) -> list[str]:
     """
     Extract all anchor tag hrefs from the response text that match the given regex.
 
     Args:
         request_result (requests.Response): The HTTP response object containing the HTML page.
-        regex (str): The regular expression pattern to match hrefs.
+        regex (str | re.Pattern[str]): The regular expression pattern to match hrefs.
 
     Returns:
         list[str]: A list of href strings that match the regex.
     """
     logger.debug("Extracting links from response with regex: %s", regex)
-    page: str = request_result.text
-    soup: BeautifulSoup = BeautifulSoup(page, 'html.parser')
-    links = soup.find_all('a')
-    hrefs: list[str] = []
-    for link in links:
-        href = link.attrs.get('href')
-        if href is not None:
-            hrefs.append(href)
-    hrefs_clean: list[str] = [href for href in hrefs if re.match(regex, href)]
+    # xpath runs in C and hands back the href strings directly, skipping the
+    # per-node Tag wrapping a BeautifulSoup traversal would pay for each anchor
+    doc = to_tree(request_result)
+    pattern = re.compile(regex)
+    hrefs_clean: list[str] = [href for href in _HREF_XPATH(doc) if pattern.match(href)]
     logger.info("Extracted %d links matching regex.", len(hrefs_clean))
-    return hrefs_clean
\ No newline at end of file
+    return hrefs_clean
@@ -2,8 +2,21 @@
 Patterns used for scraping the website urls and maintaining the state of the scraping process.
 """
 
+import re
+
 REGLEMENT_REGEX = r'^/index.php\?page=Entreprise\.EntrepriseDownloadReglement&id=([a-zA-Z\d=]+)&orgAcronyme=([\da-z]+)$'
 BOAMP_REGEX = r'^https?://www\.boamp\.fr/(?:index\.php/)?avis/detail/([\d-]+)(?:/[\d]+)?$'
 URL_SEARCH = 'https://www.marches-publics.gouv.fr/?page=Entreprise.EntrepriseAdvancedSearch&AllCons'
 LINK_REGEX = r'^https://www\.marches-publics\.gouv\.fr/app\.php/entreprise/consultation/([\d]+)\?orgAcronyme=([\da-z]+)$'
-PAGE_STATE_REGEX = 'name="PRADO_PAGESTATE" id="PRADO_PAGESTATE" value="([a-zA-Z0-9/+=]+)"'
\ No newline at end of file
+PAGE_STATE_REGEX = 'name="PRADO_PAGESTATE" id="PRADO_PAGESTATE" value="([a-zA-Z0-9/+=]+)"'
+
+# compiled once at import: these run on every link of every crawled page, so
+# the callers skip the re-module cache lookup per call
+REGLEMENT_RE = re.compile(REGLEMENT_REGEX)
+BOAMP_RE = re.compile(BOAMP_REGEX)
+LINK_RE = re.compile(LINK_REGEX)
+PAGE_STATE_RE = re.compile(PAGE_STATE_REGEX)
+
+# bytes variant for scanning response bodies directly: the PAGESTATE token is
+# pure ASCII, so searching response.content skips decoding the whole page
+PAGE_STATE_RE_B = re.compile(PAGE_STATE_REGEX.encode('ascii'))
\ No newline at end of file
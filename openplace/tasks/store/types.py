@@ -31,7 +31,9 @@ class StorageType(Enum):
     TEMP = "temp"  # Temporary directory
 
 
-@dataclass
+# slots: extraction runs hold thousands of these in memory at once, and
+# skipping the per-instance dict keeps that footprint down
+@dataclass(slots=True)
 class ArchiveContent:
     """Raw markdown content of an archive file after extraction.
     """
@@ -1,7 +1,14 @@
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+try:
+    # optional C-accelerated parser for label ingestion; stdlib json otherwise
+    import orjson
+except ImportError:
+    orjson = None
+
 import openplace.storage.local.queries as q
 
 from rich.progress import track
@@ -14,6 +21,9 @@ from openplace.tasks.scrape.fetch import PostingFileFetcher
 
 logger = logging.getLogger(__name__)
 
+MAX_CONCURRENT_POSTINGS = 8
+"""Bound on postings fetched in parallel, to stay polite with the PLACE servers."""
+
 def fetch_posting_files(
     posting: Posting, 
     storage: StorageType = StorageType.LOCAL,
@@ -22,33 +32,36 @@ def fetch_posting_files(
     """
     Fetch the files of a posting.
     """
-    logger.info(f"Starting fetch_posting_files for posting_id={posting.id}")
+    logger.info("Starting fetch_posting_files for posting_id=%s", posting.id)
     if storage == StorageType.LOCAL:
         engine, session = connect_to_db()
         create_tables(engine)
         logger.debug("Connected to DB and ensured tables exist.")
     else:
-        logger.error(f"Unsupported storage type: {storage}")
+        logger.error("Unsupported storage type: %s", storage)
         raise ValueError(f"Unsupported storage type: {storage}")
 
     links = q.get_posting_links(posting.id, session)
-    logger.debug(f"Fetched posting links for posting_id={posting.id}: {links}")
+    logger.debug("Fetched posting links for posting_id=%s: %s", posting.id, links)
 
     fetcher = PostingFileFetcher(str(posting.id), posting.org_acronym, file_writer)
-    for link in links:
-        try:
-            filename, file_size = fetcher(link.kind, link.url)
-            logger.info(f"Fetched file for link={link.url}, filename={filename}, size={file_size}")
+    try:
+        # files download concurrently on the fetcher's shared pool; entries
+        # are recorded on this session as results come back, and the status
+        # is written once for the whole posting
+        results = fetcher.fetch_all((link.kind, link.url) for link in links)
+        for kind, filename, file_size in results:
+            logger.info("Fetched %s file, filename=%s, size=%s", kind, filename, file_size)
             if filename is not None:
-                archive_name = local_archive_name(str(posting.id), filename, link.kind)
+                archive_name = local_archive_name(str(posting.id), filename, kind)
                 q.record_archive_entries(archive_name, posting.id, session)
-                logger.debug(f"Created zip entry for filename={filename}, posting_id={posting.id}")
-        except Exception as e:
-            logger.error(f"Error fetching file for link={link.url}: {e}")
-            q.update_posting_fetching_status(posting.id, q.FetchingStatus.FAILURE, session)
-            raise e
+                logger.debug("Created zip entry for filename=%s, posting_id=%s", filename, posting.id)
+    except Exception as e:
+        logger.error("Error fetching files for posting_id=%s: %s", posting.id, e)
+        q.update_posting_fetching_status(posting.id, q.FetchingStatus.FAILURE, session)
+        raise e
     q.update_posting_fetching_status(posting.id, q.FetchingStatus.SUCCESS, session)
-    logger.info(f"Completed fetch_posting_files for posting_id={posting.id}")
+    logger.info("Completed fetch_posting_files for posting_id=%s", posting.id)
     return links
 
 def download_pending_files(
@@ -73,31 +86,53 @@ def download_pending_files(
     else:
         raise ValueError(f"Unsupported storage type: {storage}")
 
-    links_postings = q.get_pending_links(session=session)
-
-    records = (
-        links_postings if not display_progress
-        else track(links_postings, description="Retrieving pending tasks", total=len(links_postings))
-    )
+    postings = q.get_pending_links(session=session)
 
     num_success, num_failure = 0, 0
 
-    for posting, link in records:
-        fetcher = PostingFileFetcher(str(posting.id), posting.org_acronym, fs_writer)
-        file_name, file_size = fetcher(link.kind, link.url)
+    # postings are independent and the work is dominated by waiting on the
+    # PLACE servers, so fetch them in parallel; the PRADO page-state dance
+    # keeps each posting's own links sequential inside its worker
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_POSTINGS) as executor:
+        futures = [executor.submit(_fetch_posting_links, posting) for posting in postings]
+        completed = (
+            as_completed(futures) if not display_progress
+            else track(as_completed(futures), description="Retrieving pending tasks", total=len(futures))
+        )
+        for future in completed:
+            successes, failures = future.result()
+            num_success += successes
+            num_failure += failures
+
+    logger.info("Completed `retrieve_pending_tasks`, found %s success and %s failures.", num_success, num_failure)
+    return num_success, num_failure
+
+
+def _fetch_posting_links(posting: Posting) -> tuple[int, int]:
+    """
+    Fetch all pending links of one posting and record the results.
+    Runs in a worker thread, which owns one session for the whole posting:
+    archive entries reuse it and the fetching status is written once at the
+    end instead of once per file.
+    """
+    num_success, num_failure = 0, 0
+    _, session = connect_to_db()
+    fetcher = PostingFileFetcher(str(posting.id), posting.org_acronym, fs_writer)
+    # the posting's files are independent of each other, so they download
+    # concurrently on the fetcher's shared pool
+    results = fetcher.fetch_all((link.kind, link.url) for link in posting.links)
+    for kind, file_name, file_size in results:
         if file_name is not None:
-            archive_name = local_archive_name(str(posting.id), file_name, link.kind)
+            archive_name = local_archive_name(str(posting.id), file_name, kind)
             q.record_archive_entries(archive_name, posting.id, session)
-            logger.debug(f"Created zip entry for filename={file_name}, posting_id={posting.id}")
+            logger.debug("Created zip entry for filename=%s, posting_id=%s", file_name, posting.id)
             num_success += 1
-            q.update_posting_fetching_status(posting.id, q.FetchingStatus.SUCCESS, session)
         else:
             num_failure += 1
-            q.update_posting_fetching_status(posting.id, q.FetchingStatus.FAILURE, session)
-
-        logger.info(f"Completed fetch_posting_files for posting_id={posting.id}")
 
-    logger.info(f"Completed `retrieve_pending_tasks`, found {num_success} success and {num_failure} failures.")
+    status = q.FetchingStatus.FAILURE if num_failure else q.FetchingStatus.SUCCESS
+    q.update_posting_fetching_status(posting.id, status, session)
+    logger.info("Completed fetch_posting_files for posting_id=%s", posting.id)
     return num_success, num_failure
 
 
@@ -121,18 +156,20 @@ def ingest_labels(
     files = list(source_dir.glob("*.jsonl")) # TODO: rename to *.labels.json or *.labels.jsonl if labels are stored in jsonl format
 
     if not files:
-        logger.error(f"No label files found in {input_dir}")
+        logger.error("No label files found in %s", input_dir)
         raise ValueError(f"No label files found in {input_dir}")
 
     for file in files:
         # TODO: add a proper way to handle label file format & naming
         file_id = get_id(file)
-        data = json.loads(file.read_text())
+        # read_bytes + a bytes-accepting parser skips the str decode pass
+        raw = file.read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
         q.upsert_archive_labels(
             archive_id=file_id,
             label_data=data,
         )
         q.set_archive_content_inference_done(file_id)
-        logger.info(f"Ingested labels for file {file} with id {file_id}")
+        logger.info("Ingested labels for file %s with id %s", file, file_id)
 
-    logger.info(f"Ingested {len(files)} labels from {input_dir}")
\ No newline at end of file
+    logger.info("Ingested %s labels from %s", len(files), input_dir)
\ No newline at end of file
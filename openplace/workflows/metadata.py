@@ -1,6 +1,7 @@
 import datetime
 import requests
 import logging
+from concurrent.futures import ThreadPoolExecutor
 import openplace.tasks.scrape.fetch as fetch
 import openplace.tasks.scrape.parse as parse
 import openplace.tasks.scrape.navigate as navigate
@@ -12,15 +13,22 @@ from openplace.storage.local.settings import connect_to_db, create_tables
 from openplace.tasks.store.types import StorageType, FileWriter
 from openplace.tasks.store.writers import fs_writer
 from openplace.tasks.scrape.fetch import PostingFileFetcher
-from openplace.storage.local.queries import get_posting_links, create_zip_entries, update_posting_fetching_status, is_posting_present
+from openplace.tasks.scrape.patterns import LINK_RE
+from openplace.storage.local.queries import get_posting_links, create_zip_entries, update_posting_fetching_status, is_posting_present, get_posting_ids
 
 logger = logging.getLogger(__name__)
 
+MAX_CONCURRENT_PAGES = 8
+"""Bound on posting pages fetched in parallel, to stay polite with the PLACE servers."""
+
 def fetch_persist_posting(
     response: requests.Response,
     posting_id: str,
     org_acronym: str,
     storage: StorageType = StorageType.LOCAL,
+    session: Session | None = None,
+    commit: bool = True,
+    check_present: bool = True,
 ) -> Posting | None:
     """
     Fetch and persist a PLACE public market posting.
@@ -30,76 +38,94 @@ def fetch_persist_posting(
         posting_id (str): The ID of the posting.
         org_acronym (str): The acronym of the organization.
         storage (StorageType): The storage type.
+        session (Session | None): Session to persist into; a new one is opened if not given.
+        commit (bool): Whether to commit immediately. Batch callers pass False
+        and commit once per batch to amortize the per-transaction fsync.
+        check_present (bool): Whether to run the per-posting existence SELECT.
+        Batch callers that already dedup against a preloaded id set pass False.
 
     Returns:
         Posting | None: The persisted posting or None if the posting already exists.
     """
-    logger.info(f"Starting fetch_persist_posting for posting_id={posting_id}")
+    logger.info("Starting fetch_persist_posting for posting_id=%s", posting_id)
     if storage == StorageType.LOCAL:
-        engine, session = connect_to_db()
-        create_tables(engine)
-        if is_posting_present(posting_id, session):
-            logger.info(f"Posting with id {posting_id} already present, skipping")
-            return None
-        else:
-            logger.info(f"Posting with id {posting_id} not present, creating")
+        if session is None:
+            engine, session = connect_to_db()
+            create_tables(engine)
+        if check_present:
+            if is_posting_present(posting_id, session):
+                logger.info("Posting with id %s already present, skipping", posting_id)
+                return None
+            else:
+                logger.info("Posting with id %s not present, creating", posting_id)
     else:
-        logger.error(f"Unsupported storage type: {storage}")
+        logger.error("Unsupported storage type: %s", storage)
         raise ValueError(f"Unsupported storage type: {storage}")
 
 
-    posting_info = parse.parse_posting_info(response)
-    logger.debug(f"Parsed posting_info: {posting_info}")
-    posting_links = parse.parse_posting_links(response)
-    logger.debug(f"Parsed posting_links: {posting_links}")
+    # build the tree once and reuse it: info and links come from the same page
+    tree = parse.to_tree(response)
+    posting_info = parse.parse_posting_info(tree)
+    logger.debug("Parsed posting_info: %s", posting_info)
+    posting_links = parse.parse_posting_links(tree)
+    logger.debug("Parsed posting_links: %s", posting_links)
     posting = Posting(
         **posting_info,
         org_acronym=org_acronym,
         id=int(posting_id),
         url=response.url,
     )
+    # one clock read for the whole batch: links ingested together share
+    # the same last_updated instant
+    now = datetime.datetime.now(datetime.timezone.utc)
     posting_links = [
         PostingLink(
             posting_id=posting.id,
             url=link,
             kind=kind,
-            last_updated=datetime.datetime.now(datetime.timezone.utc)
+            last_updated=now
         ) for kind, links in posting_links.items()
         for link in links
     ]
     if session is not None:
         session.add_all([posting, *posting_links])
-        session.commit()
-        logger.info(f"Persisted posting and links for posting_id={posting_id}")
-    logger.info(f"Completed fetch_persist_posting for posting_id={posting_id}")
+        if commit:
+            session.commit()
+        logger.info("Persisted posting and links for posting_id=%s", posting_id)
+    logger.info("Completed fetch_persist_posting for posting_id=%s", posting_id)
     return posting
 
 
-def _fetch_and_persist_if_new(link: str, session: Session, storage: StorageType) -> Posting | None:
+def _persist_if_new(
+    page: tuple[str, str, requests.Response],
+    session: Session,
+    storage: StorageType,
+    known_ids: set[int],
+) -> Posting | None:
     """
-    Fetch a posting and confirm it is new.
+    Persist an already-fetched posting page if it is new.
+    Runs in the caller's thread: the session is not shared with the fetch pool.
 
     Args:
-        link (str): The link to the posting.
+        page (tuple[str, str, requests.Response]): Output of `fetch_posting_page`.
         session (Session): The SQLModel session.
         storage (StorageType): The storage type.
+        known_ids (set[int]): Ids already in the database, preloaded once by the
+        caller; dedup is a set lookup instead of a SELECT per link.
 
     Returns:
         Posting | None: The new posting, or None if the posting was already present.
     """
-    try:
-        posting_id, org_acronym, response = fetch.fetch_posting_page(link)
-        logger.info(f"Fetched posting page for link={link}, posting_id={posting_id}")
-        ## TODO: add a check to see if the posting is already in the database
-        if is_posting_present(posting_id, session):
-            logger.info(f"Posting with id {posting_id} already present, skipping")
-            return None
-        posting = fetch_persist_posting(response, posting_id, org_acronym, storage=storage)
-        logger.info(f"Discovered and persisted posting_id={posting_id}")
-        return posting
-    except Exception as e:
-        logger.error(f"Error processing link={link}: {e}")
-        raise e
+    posting_id, org_acronym, response = page
+    if int(posting_id) in known_ids:
+        logger.info("Posting with id %s already present, skipping", posting_id)
+        return None
+    # defer the commit: the caller flushes each batch in one transaction
+    posting = fetch_persist_posting(response, posting_id, org_acronym, storage=storage, session=session, commit=False, check_present=False)
+    if posting is not None:
+        known_ids.add(int(posting_id))
+    logger.info("Discovered and persisted posting_id=%s", posting_id)
+    return posting
 
 
 def discover_new_postings(
@@ -127,16 +153,17 @@ def discover_new_postings(
     if debug:
         logging.basicConfig(level=logging.DEBUG)
 
-    logger.info(f"Starting discover_new_postings with n={n}, storage={storage}")
+    logger.info("Starting discover_new_postings with n=%s, storage=%s", n, storage)
     if storage == StorageType.LOCAL:
         engine, session = connect_to_db()
         create_tables(engine)
         logger.debug("Connected to DB and ensured tables exist.")
     else:
-        logger.error(f"Unsupported storage type: {storage}")
+        logger.error("Unsupported storage type: %s", storage)
         raise ValueError(f"Unsupported storage type: {storage}")
 
     new_postings = []
+    known_ids = get_posting_ids(session)
 
     if not resume:
         logger.info("Not taking existing postings into account (because resume=False)")
@@ -147,23 +174,39 @@ def discover_new_postings(
 
     logger.info("Initialized PlacePostingIterator.")
     
-    for posting_links in place_posting_iterator.iter_n_batches(n, ensure_n_new_links):
-        logger.debug(f"Fetched posting_links batch: {posting_links}")
-        for link in posting_links:
-            try:
-                posting = _fetch_and_persist_if_new(link, session, storage)
-                if posting is not None:
-                    new_postings.append(posting)
-            except Exception as e:
-                logger.error(f"Error processing link={link}: {e}")
-                raise e
+    # posting pages are fetched in parallel (pure network wait), while parsing
+    # and persistence stay in this thread so the session is never shared; the
+    # prefetching iterator additionally keeps the next pagination POST in
+    # flight while this thread works through the current batch
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_PAGES) as executor:
+        for posting_links in place_posting_iterator.iter_n_batches_prefetch(n, ensure_n_new_links):
+            logger.debug("Fetched posting_links batch: %s", posting_links)
+            # the posting id is part of the link, so known postings are
+            # skipped before any page is downloaded — resuming a crawl costs
+            # no network for pages already in the database
+            fresh_links = [
+                link for link in posting_links
+                if (match := LINK_RE.match(link)) is None or int(match.group(1)) not in known_ids
+            ]
+            futures = [executor.submit(fetch.fetch_posting_page, link) for link in fresh_links]
+            for link, future in zip(fresh_links, futures):
+                try:
+                    posting = _persist_if_new(future.result(), session, storage, known_ids)
+                    if posting is not None:
+                        new_postings.append(posting)
+                except Exception as e:
+                    logger.error("Error processing link=%s: %s", link, e)
+                    raise e
+                if ensure_n_new_links is not None and len(new_postings) >= ensure_n_new_links:
+                    logger.info("Reached %s new postings, stopping inner loop", ensure_n_new_links)
+                    break
+            # one commit per batch instead of one per posting: amortizes the
+            # transaction + fsync cost across the whole page of links
+            session.commit()
             if ensure_n_new_links is not None and len(new_postings) >= ensure_n_new_links:
-                logger.info(f"Reached {ensure_n_new_links} new postings, stopping inner loop")
+                logger.info("Reached %s new postings, stopping outer loop", ensure_n_new_links)
                 break
-        if ensure_n_new_links is not None and len(new_postings) >= ensure_n_new_links:
-            logger.info(f"Reached {ensure_n_new_links} new postings, stopping outer loop")
-            break
    
-    logger.info(f"Completed discover_new_postings, found {len(new_postings)} new postings.")
+    logger.info("Completed discover_new_postings, found %s new postings.", len(new_postings))
     return new_postings
 